@@ -0,0 +1,6 @@
+from utils.log_utils import LogBlock
+
+# Shared loggers for the snowflake_funcs modules, built once at import so every
+# import path logs through the same instances.
+logger = LogBlock(logger_name="data_pipeline", max_depth=3)
+overlap_logger = LogBlock(logger_name="data_pipeline", max_depth=6)
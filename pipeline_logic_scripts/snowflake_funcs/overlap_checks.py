@@ -1,5 +1,40 @@
 from datetime import datetime
-from utils.log_utils import LogBlock
+from functools import lru_cache
+import pandas as pd
+from snowflake_utils.snowflake_query_client import QueryResult
+from pipeline_logic_scripts.snowflake_funcs._logger import overlap_logger
+from pipeline_logic_scripts.snowflake_funcs.snowflake_tasks import _qualified_table, _render_sql, _sql_digest
+
+_OVERLAP_FOR_INPUT_COLUMNS = [
+    "pipeline_name",
+    "index_name",
+    "pipeline_status",
+    "query_window_start_ts",
+    "query_window_end_ts",
+]
+
+_OVERLAP_FOR_INPUT_SQL = """
+        SELECT
+            pipeline_name,
+            index_name,
+            pipeline_status,
+            query_window_start_ts,
+            query_window_end_ts
+        FROM {table}
+        WHERE query_window_start_day <= %(end_day)s
+          AND query_window_end_day >= %(start_day)s
+          AND query_window_start_ts < %(end_ts)s
+          AND query_window_end_ts > %(start_ts)s
+          AND pipeline_name = %(pipeline_name)s
+          AND index_name = %(index_name)s
+"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(ts: str) -> datetime:
+    """Parses an ISO 8601 timestamp; repeat windows hit the cache."""
+    return datetime.fromisoformat(ts)
+
 
 def find_overlapping_records_for_input(
     snowflake_client,
@@ -10,12 +45,17 @@ def find_overlapping_records_for_input(
     database: str,
     schema: str,
     table: str,
-) -> dict:
+) -> QueryResult:
     """
     Checks if any existing records in Snowflake overlap with the given time window.
 
-    Uses day-level filtering via query_window_start_day and query_window_end_day
-    before checking actual timestamp overlaps.
+    Filters on query_window_start_day and query_window_end_day alongside the
+    timestamp overlap predicates so Snowflake can prune by day, and returns only
+    the columns that identify each overlapping window.
+
+    An empty or inverted range (start_ts >= end_ts) cannot overlap anything and
+    returns immediately without querying. The check compares the parsed
+    datetimes, and is skipped (the query runs) when only one carries a UTC offset.
 
     Args:
         snowflake_client (SnowflakeQueryClient): Active client instance.
@@ -28,43 +68,53 @@ def find_overlapping_records_for_input(
         table (str): Snowflake table to search.
 
     Returns:
-        dict:
-            {
-                "query_id": str,
-                "data": pd.DataFrame (may be empty)
-            }
+        QueryResult:
+            (
+                query_id: str,  # "SKIPPED" for an empty input range
+                data: pd.DataFrame (may be empty) with columns
+                    pipeline_name, index_name, pipeline_status,
+                    query_window_start_ts, query_window_end_ts
+            )
     """
-    logger = LogBlock(logger_name="data_pipeline", max_depth=6)
+    logger = overlap_logger
     key = "CHECK_OVERLAP_FOR_INPUT"
-    logger.log_start(key)
 
     try:
-        start_day = datetime.fromisoformat(start_ts).date().isoformat()
-        end_day = datetime.fromisoformat(end_ts).date().isoformat()
+        start_dt = _parse_iso(start_ts)
+        end_dt = _parse_iso(end_ts)
     except Exception as e:
-        logger.log_failure(key, f"Invalid timestamp format: {e}")
+        logger.error(key=key, message=f"STATUS: FAILED\nERROR: Invalid timestamp format: {e}")
         raise ValueError(f"Invalid timestamp format: {e}")
 
-    query = f"""
-        WITH filtered_day_records AS (
-            SELECT *
-            FROM {table}
-            WHERE query_window_start_day <= %(end_day)s
-              AND query_window_end_day >= %(start_day)s
-              AND pipeline_name = %(pipeline_name)s
-              AND index_name = %(index_name)s
+    # A naive/aware pair cannot be compared here; let Snowflake evaluate it
+    comparable = (start_dt.tzinfo is None) == (end_dt.tzinfo is None)
+    if comparable and start_dt >= end_dt:
+        logger.info_lazy(
+            key=key,
+            message_factory=lambda: f"STATUS: SKIPPED | EMPTY INPUT RANGE: [{start_ts} - {end_ts}]"
         )
-        SELECT *
-        FROM filtered_day_records
-        WHERE query_window_start_ts < %(end_ts)s
-          AND query_window_end_ts > %(start_ts)s
-    """
+        return QueryResult(
+            query_id="SKIPPED",
+            data=pd.DataFrame(columns=_OVERLAP_FOR_INPUT_COLUMNS)
+        )
+
+    query = _render_sql(_OVERLAP_FOR_INPUT_SQL, _qualified_table(database, schema, table))
+
+    logger.debug_lazy(
+        key=key,
+        message_factory=lambda: (
+            f"STATUS: STARTED\n"
+            f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}'\n"
+            f"INPUT RANGE: [{start_ts} - {end_ts}]\n"
+            f"QUERY:\n{query}"
+        )
+    )
 
     query_params = {
         "pipeline_name": pipeline_name,
         "index_name": index_name,
-        "start_day": start_day,
-        "end_day": end_day,
+        "start_day": start_dt.date().isoformat(),
+        "end_day": end_dt.date().isoformat(),
         "start_ts": start_ts,
         "end_ts": end_ts
     }
@@ -72,36 +122,29 @@ def find_overlapping_records_for_input(
     try:
         result = snowflake_client.fetch_all_rows_as_dataframe(
             query=query,
-            database=database,
-            schema=schema,
+            database=None,
+            schema=None,
             query_params=query_params
         )
 
-        df = result["data"]
-        query_id = result["query_id"]
+        df = result.data
+        query_id = result.query_id
 
-        logger.log_complete(
+        logger.info_lazy(
             key=key,
-            message=(
-                f"STATUS: COMPLETED\n"
-                f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}'\n"
-                f"INPUT RANGE: [{start_ts} - {end_ts}]\n"
-                f"RECORDS FOUND: {len(df)}\n"
-                f"QUERY ID: {query_id}\n"
-                f"QUERY:\n{query.strip()}"
-            )
+            message_factory=lambda: f"STATUS: COMPLETED | QUERY ID: {query_id} | RECORDS FOUND: {len(df)} | QUERY DIGEST: {_sql_digest(query)}"
         )
         return result
 
     except Exception as e:
-        logger.log_failure(
+        logger.error(
             key=key,
             message=(
                 f"STATUS: FAILED\n"
                 f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}'\n"
                 f"INPUT RANGE: [{start_ts} - {end_ts}]\n"
                 f"ERROR: {str(e)}\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY:\n{query}"
             )
         )
         raise e
@@ -1,9 +1,351 @@
+import copy
+import hashlib
+import re
+import threading
+import time
 from datetime import datetime
-from pipeline_logic_scripts.snowflake_funcs.snowflake_query_client import SnowflakeQueryClient
+from functools import lru_cache
+from snowflake_utils.snowflake_query_client import SnowflakeQueryClient, QueryResult
 from utils.log_utils import LogBlock
+from pipeline_logic_scripts.snowflake_funcs._logger import logger, overlap_logger
 from typing import Optional
 
-logger = LogBlock(logger_name="data_pipeline", max_depth=3)
+# (database, schema, table) for every permanent or transient table whose
+# CREATE TABLE IF NOT EXISTS already succeeded in this process. Repeating it
+# is a no-op whatever the column list says, so repeat calls can skip the
+# Snowflake round-trip.
+_CREATED_TABLES: set = set()
+
+# Groups: OR REPLACE, table kind, IF NOT EXISTS, table name
+_CREATE_TABLE_NAME_RE = re.compile(
+    r"CREATE\s+(OR\s+REPLACE\s+)?(?:(?:LOCAL|GLOBAL)\s+)?(TEMP(?:ORARY)?\s+|TRANSIENT\s+|VOLATILE\s+)?"
+    r"TABLE\s+(IF\s+NOT\s+EXISTS\s+)?([A-Za-z0-9_$.\"]+)",
+    re.IGNORECASE
+)
+
+
+def _iso_ts_sql(column: str) -> str:
+    """
+    SQL rendering `column` as ISO 8601 text with microseconds, as datetime.isoformat() would.
+
+    TIMESTAMP_TZ/LTZ values keep their +HH:MM offset; TIMESTAMP_NTZ has none to keep.
+    """
+    return (
+        f"IFF(STARTSWITH(SYSTEM$TYPEOF({column}), 'TIMESTAMP_NTZ'), "
+        f"TO_VARCHAR({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS.FF6'), "
+        f"TO_VARCHAR({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS.FF6TZH:TZM'))"
+    )
+
+
+# SQL templates are parameterised only by the (fully-qualified) table name and
+# bind every value, so the text is identical across calls and Snowflake's
+# result cache can answer repeats. Keep non-deterministic functions such as
+# CURRENT_TIMESTAMP() out of read queries; they disable result reuse.
+# Window timestamps are rendered as ISO 8601 text by Snowflake (TO_VARCHAR)
+# so rows arrive ready to serialise; _isoformat_datetimes() only has to touch
+# any other datetime columns. Sorts and filters name the aliased table's column
+# (t.query_window_start_ts), not the same-named text column SELECT * REPLACE
+# produces.
+_COUNT_GROUPED_BY_STATUS_SQL = """
+        SELECT pipeline_status, COUNT(*) AS row_count
+        FROM {table}
+        WHERE pipeline_status IN (%(statuses)s)
+        GROUP BY pipeline_status
+"""
+
+_OLDEST_BY_STATUS_SQL = f"""
+        SELECT * REPLACE (
+            {_iso_ts_sql("query_window_start_ts")} AS query_window_start_ts,
+            {_iso_ts_sql("query_window_end_ts")} AS query_window_end_ts
+        )
+        FROM {{table}} AS t
+        WHERE pipeline_status = %(pipeline_status)s
+        ORDER BY t.query_window_start_ts ASC
+        LIMIT 1
+"""
+
+_COUNT_BY_STATUS_SQL = """
+        SELECT COUNT(*)
+        FROM {table}
+        WHERE pipeline_status = %(pipeline_status)s
+"""
+
+_LATEST_BY_STATUS_SQL = f"""
+        SELECT * REPLACE (
+            {_iso_ts_sql("query_window_start_ts")} AS query_window_start_ts,
+            {_iso_ts_sql("query_window_end_ts")} AS query_window_end_ts
+        )
+        FROM {{table}} AS t
+        WHERE pipeline_status = %(pipeline_status)s
+        ORDER BY t.query_window_start_ts DESC
+        LIMIT 1
+"""
+
+# Picks the oldest row in `from_status` and flips it to `to_status` in one
+# request. Snowflake has no UPDATE ... RETURNING, so the claimed row's key is
+# held in session variables and re-read inside the same transaction. The
+# UPDATE re-checks the status, so a concurrent claimer updates 0 rows.
+_CLAIM_OLDEST_SQL = f"""
+        BEGIN;
+        SET (claim_pipeline_name, claim_index_name, claim_start_ts) = (
+            SELECT pipeline_name, index_name, query_window_start_ts
+            FROM {{table}}
+            WHERE pipeline_status = %(from_status)s
+            ORDER BY query_window_start_ts ASC
+            LIMIT 1
+        );
+        UPDATE {{table}}
+        SET pipeline_status = %(to_status)s
+        WHERE pipeline_status = %(from_status)s
+          AND pipeline_name = $claim_pipeline_name
+          AND index_name = $claim_index_name
+          AND query_window_start_ts = $claim_start_ts;
+        SELECT * REPLACE (
+            {_iso_ts_sql("query_window_start_ts")} AS query_window_start_ts,
+            {_iso_ts_sql("query_window_end_ts")} AS query_window_end_ts
+        )
+        FROM {{table}} AS t
+        WHERE pipeline_status = %(to_status)s
+          AND pipeline_name = $claim_pipeline_name
+          AND index_name = $claim_index_name
+          AND t.query_window_start_ts = $claim_start_ts;
+        COMMIT
+"""
+_CLAIM_OLDEST_STATEMENTS = 5
+
+_DISCONTINUOUS_WINDOWS_SQL = f"""
+        WITH ordered_windows AS (
+            SELECT
+                query_window_start_ts,
+                query_window_end_ts,
+                LAG(query_window_end_ts) OVER (
+                    ORDER BY query_window_start_ts
+                ) AS prev_end_ts
+            FROM {{table}}
+            WHERE DATE(query_window_start_ts) = %(day)s
+              AND pipeline_name = %(pipeline_name)s
+              AND index_name = %(index_name)s
+        )
+        SELECT
+            {_iso_ts_sql("prev_end_ts")} AS missing_query_window_start_ts,
+            {_iso_ts_sql("query_window_start_ts")} AS missing_query_window_end_ts
+        FROM ordered_windows
+        WHERE prev_end_ts IS NOT NULL
+          AND query_window_start_ts != prev_end_ts
+        ORDER BY prev_end_ts
+"""
+
+# Sort-based overlap scan: for each distinct start, the furthest end reached by
+# any window that starts strictly earlier. A window overlaps when it starts
+# before that end; the earliest-starting window holding that end is reported
+# as its partner, so each overlapping window appears once.
+# One sort plus equality joins instead of an O(N^2) range self-join.
+_OVERLAPPING_WINDOWS_SQL = """
+        WITH filtered_day_data AS (
+            SELECT query_window_start_ts, query_window_end_ts
+            FROM {table}
+            WHERE pipeline_name = %(pipeline_name)s
+              AND index_name = %(index_name)s
+              AND query_window_start_ts < DATEADD(day, 1, %(date)s::DATE)
+              AND query_window_end_ts > %(date)s::TIMESTAMP
+        ),
+        max_end_by_start AS (
+            SELECT query_window_start_ts, MAX(query_window_end_ts) AS max_end_ts
+            FROM filtered_day_data
+            GROUP BY query_window_start_ts
+        ),
+        running_max AS (
+            SELECT
+                query_window_start_ts,
+                MAX(max_end_ts) OVER (
+                    ORDER BY query_window_start_ts
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                ) AS prev_max_end_ts
+            FROM max_end_by_start
+        ),
+        ranked_partners AS (
+            SELECT
+                d.query_window_start_ts AS source_window_start_ts,
+                d.query_window_end_ts AS source_window_end_ts,
+                p.query_window_start_ts AS overlaps_with_start_ts,
+                p.query_window_end_ts AS overlaps_with_end_ts,
+                ROW_NUMBER() OVER (
+                    PARTITION BY d.query_window_start_ts, d.query_window_end_ts
+                    ORDER BY p.query_window_start_ts
+                ) AS partner_rank
+            FROM filtered_day_data d
+            INNER JOIN running_max r
+              ON d.query_window_start_ts = r.query_window_start_ts
+            INNER JOIN filtered_day_data p
+              ON p.query_window_end_ts = r.prev_max_end_ts
+             AND p.query_window_start_ts < d.query_window_start_ts
+            WHERE d.query_window_start_ts < r.prev_max_end_ts
+        )
+        SELECT
+            source_window_start_ts,
+            source_window_end_ts,
+            overlaps_with_start_ts,
+            overlaps_with_end_ts
+        FROM ranked_partners
+        WHERE partner_rank = 1
+        ORDER BY source_window_start_ts, overlaps_with_start_ts;
+"""
+
+_TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_$.]*$")
+
+# Log bodies for the count and oldest/latest helpers; only the %s fields vary per call.
+_MSG_COUNT_STARTED = "STATUS: STARTED\nPARAMS: pipeline_status IN %s\nQUERY:\n%s"
+_MSG_COUNT_COMPLETED = "STATUS: COMPLETED\nCOUNTS: %s\nQUERY ID: %s\nQUERY DIGEST: %s"
+_MSG_COUNT_FAILED = "STATUS: FAILED\nERROR: %s\nQUERY:\n%s"
+_MSG_PICK_STARTED = "STATUS: STARTED\nFILTER: pipeline_status = '%s'\nQUERY:\n%s"
+_MSG_PICK_NO_RECORD = (
+    "STATUS: COMPLETED\nQUERY ID: %s\nRESULT: No matching records\n"
+    "FILTER: pipeline_status = '%s'\nQUERY DIGEST: %s"
+)
+_MSG_PICK_COMPLETED = (
+    "STATUS: COMPLETED\nQUERY ID: %s\nRECORD PICKED:\n%s\n"
+    "FILTER: pipeline_status = '%s'\nQUERY DIGEST: %s"
+)
+_MSG_PICK_FAILED = "STATUS: FAILED\nERROR: %s\nFILTER: pipeline_status = '%s'\nQUERY:\n%s"
+
+# Log keys for the oldest/latest pickers, built once for the known statuses.
+_KNOWN_PIPELINE_STATUSES = ("pending", "completed", "failed", "in_progress", "skipped")
+_PICK_KEYS = {
+    (kind, status): f"PICK_{kind.upper()}_{status.upper()}"
+    for kind in ("oldest", "latest")
+    for status in _KNOWN_PIPELINE_STATUSES
+}
+
+# (query_kind, database, schema, table_name, pipeline_status) -> (fetched_at, result)
+# for the count and oldest/latest picker helpers, so polling loops reuse a
+# recent answer. Writers to a status table must call invalidate_status_cache().
+_STATUS_CACHE: dict = {}
+# Guards _STATUS_CACHE; the helpers may be called from several threads at once
+_STATUS_CACHE_LOCK = threading.Lock()
+_STATUS_CACHE_MAXSIZE = 256
+_STATUS_CACHE_TTL_SECONDS = 5.0
+
+
+def _qualified_table(database: str, schema: str, table_name: str) -> str:
+    """
+    Returns `database.schema.table_name`.
+
+    A `schema.table` name is prefixed with `database` only, and a 3-part name
+    is returned as-is. Queries built on fully-qualified names can run without
+    USE DATABASE/SCHEMA.
+    """
+    dots = table_name.count(".")
+    if dots >= 2:
+        return table_name
+    if dots == 1:
+        return f"{database}.{table_name}"
+    return f"{database}.{schema}.{table_name}"
+
+
+@lru_cache(maxsize=64)
+def _render_sql(template: str, table: str) -> str:
+    """
+    Renders a module-level SQL template for one table, once per (template, table).
+
+    Table names cannot be bound as parameters, so they are validated here,
+    once per name, before being spliced into the SQL.
+
+    Raises:
+        ValueError: If `table` is not a plain (optionally dotted) identifier.
+    """
+    if not _TABLE_NAME_RE.match(table):
+        raise ValueError(f"Invalid table name: {table!r}")
+    return template.format_map({"table": table}).strip()
+
+
+@lru_cache(maxsize=128)
+def _sql_digest(query: str) -> str:
+    """
+    Short, stable fingerprint of a SQL text for success logs (full text is logged at DEBUG).
+    """
+    return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+
+
+def _status_cache_get(cache_key: tuple, ttl_seconds: float) -> Optional[dict]:
+    """
+    Returns a copy of a fresh cached result, or None.
+
+    Hits report `"query_id": "cached:<original query id>"` so logs and callers
+    can still trace the answer back to the Snowflake query that produced it.
+    """
+    with _STATUS_CACHE_LOCK:
+        cached = _STATUS_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+        result = copy.deepcopy(cached[1])
+        result["query_id"] = f"cached:{result['query_id']}"
+        return result
+    return None
+
+
+def _status_cache_put(cache_key: tuple, result: dict) -> dict:
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE.pop(cache_key, None)
+        _STATUS_CACHE[cache_key] = (time.monotonic(), result)
+        if len(_STATUS_CACHE) > _STATUS_CACHE_MAXSIZE:
+            _STATUS_CACHE.pop(next(iter(_STATUS_CACHE)), None)
+    return copy.deepcopy(result)
+
+
+def invalidate_status_cache(table_name: str, pipeline_status: Optional[str] = None) -> None:
+    """
+    Drops cached counts and picked records for a table.
+
+    Call after any INSERT/UPDATE/DELETE on the status table so the next
+    count_records_by_pipeline_status / get_*_record_by_status call re-queries.
+
+    Args:
+        table_name (str): Table whose cached results should be dropped.
+        pipeline_status (str, optional): Limit invalidation to one status.
+    """
+    with _STATUS_CACHE_LOCK:
+        stale = [
+            cache_key for cache_key in _STATUS_CACHE
+            if cache_key[3] == table_name
+            and (pipeline_status is None or cache_key[4] == pipeline_status)
+        ]
+        for cache_key in stale:
+            _STATUS_CACHE.pop(cache_key, None)
+
+
+def _ddl_cache_key(database: str, schema: str, create_query: str) -> Optional[tuple]:
+    """
+    Key under which a successful CREATE TABLE is remembered in _CREATED_TABLES.
+
+    Uses the table name from the statement (upper-cased unless quoted, as
+    Snowflake resolves it) so reformatted DDL for the same table still hits.
+    Returns None for statements that must always run: anything without
+    IF NOT EXISTS (including CREATE OR REPLACE, which is never a no-op),
+    temporary/volatile tables (they only exist in the session that created
+    them), and DDL whose table name cannot be extracted.
+    """
+    match = _CREATE_TABLE_NAME_RE.search(create_query)
+    if match is None:
+        return None
+    or_replace, table_kind, if_not_exists, table = match.groups()
+    if or_replace or not if_not_exists:
+        return None
+    if table_kind and not table_kind.upper().startswith("TRANSIENT"):
+        return None
+    return (database, schema, table if '"' in table else table.upper())
+
+
+def _isoformat_datetimes(record: dict) -> dict:
+    """
+    Converts datetime values of a fetched row to ISO 8601 strings in place.
+
+    Only the datetime columns are rewritten, in a single pass over the row;
+    other values are left untouched and the cursor's dict is reused rather
+    than copied. Reassigning values (not keys) while iterating is safe.
+    """
+    for col, val in record.items():
+        if isinstance(val, datetime):
+            record[col] = val.isoformat()
+    return record
 
 
 def create_table_if_not_exists(
@@ -16,6 +358,9 @@ def create_table_if_not_exists(
     Executes a CREATE TABLE IF NOT EXISTS statement in Snowflake.
     Logs using a consistent structure for traceability.
 
+    Successful statements are remembered per process; calling again with the
+    same database, schema and table returns without contacting Snowflake.
+
     Args:
         snowflake_client (SnowflakeQueryClient): Snowflake client instance.
         create_query (str): Full SQL statement.
@@ -24,31 +369,88 @@ def create_table_if_not_exists(
 
     Returns:
         dict: {
-            "query_id": str,
-            "executed": True
+            "query_id": str,    # "cached:ddl" when the DDL was skipped
+            "executed": bool    # False when the DDL was skipped
+        }
+
+    Raises:
+        RuntimeError: If execution fails.
+    """
+    return create_tables_if_not_exist(
+        snowflake_client=snowflake_client,
+        create_queries=[create_query],
+        database=database,
+        schema=schema
+    )
+
+
+def create_tables_if_not_exist(
+    snowflake_client: SnowflakeQueryClient,
+    create_queries: list,
+    database: str,
+    schema: str
+) -> dict:
+    """
+    Executes several CREATE TABLE IF NOT EXISTS statements in one Snowflake request.
+
+    CREATE TABLE IF NOT EXISTS statements for permanent or transient tables
+    that already succeeded in this process are dropped from the batch;
+    the rest are joined with ';' and submitted as a single multi-statement query.
+
+    Args:
+        snowflake_client (SnowflakeQueryClient): Snowflake client instance.
+        create_queries (list[str]): Full SQL statements, one per table.
+        database (str): Target Snowflake database.
+        schema (str): Target schema.
+
+    Returns:
+        dict: {
+            "query_id": str,    # "cached:ddl" when every DDL was skipped
+            "executed": bool    # False when every DDL was skipped
         }
 
     Raises:
         RuntimeError: If execution fails.
     """
     key = "CREATE_TABLE_IF_NOT_EXISTS"
+    pending = [
+        (query, cache_key)
+        for query, cache_key in (
+            (query, _ddl_cache_key(database, schema, query)) for query in create_queries
+        )
+        if cache_key is None or cache_key not in _CREATED_TABLES
+    ]
+
+    if not pending:
+        logger.debug_lazy(
+            key=key,
+            message_factory=lambda: f"STATUS: SKIPPED (already executed in this process)\nQUERIES: {len(create_queries)}"
+        )
+        return {
+            "query_id": "cached:ddl",
+            "executed": False
+        }
+
+    batch_query = ";\n".join(query.strip().rstrip(";") for query, _ in pending)
 
-    logger.info(
+    logger.debug_lazy(
         key=key,
-        message=f"STATUS: STARTED\nQUERY:\n{create_query}"
+        message_factory=lambda: f"STATUS: STARTED\nSTATEMENTS: {len(pending)}\nQUERY:\n{batch_query}"
     )
 
     try:
         result = snowflake_client.execute_control_command(
-            query=create_query,
+            query=batch_query,
             database=database,
-            schema=schema
+            schema=schema,
+            num_statements=len(pending)
         )
 
-        logger.info(
+        logger.info_lazy(
             key=key,
-            message=f"STATUS: COMPLETED\nQUERY ID: {result['query_id']}\nQUERY:\n{create_query}"
+            message_factory=lambda: f"STATUS: COMPLETED\nQUERY ID: {result['query_id']}\nSTATEMENTS: {len(pending)}\nQUERY DIGEST: {_sql_digest(batch_query)}"
         )
+        _CREATED_TABLES.update(cache_key for _, cache_key in pending if cache_key is not None)
         return {
             "query_id": result["query_id"],
             "executed": True
@@ -57,7 +459,7 @@ def create_table_if_not_exists(
     except Exception as error:
         logger.error(
             key=key,
-            message=f"STATUS: FAILED\nQUERY:\n{create_query}\nERROR: {error}"
+            message=f"STATUS: FAILED\nQUERY:\n{batch_query}\nERROR: {error}"
         )
         raise
 
@@ -68,12 +470,16 @@ def count_records_by_pipeline_status(
     schema: str,
     pipeline_status: str,
     snowflake_client: SnowflakeQueryClient,
-    logger: LogBlock
+    logger: LogBlock,
+    cache_ttl_seconds: float = _STATUS_CACHE_TTL_SECONDS
 ) -> dict:
     """
     Executes a COUNT(*) query filtered by pipeline_status on a given table.
     Logs execution lifecycle and SQL details in a consistent structure.
 
+    Counts are reused for `cache_ttl_seconds` so tight polling loops do not
+    hit Snowflake on every iteration. Pass 0 to always query.
+
     Args:
         table_name (str): Target table name.
         database (str): Snowflake database name.
@@ -81,6 +487,7 @@ def count_records_by_pipeline_status(
         pipeline_status (str): Filter value (e.g., 'completed').
         snowflake_client (SnowflakeQueryClient): Active Snowflake client.
         logger (LogBlock): Project-standard logging instance.
+        cache_ttl_seconds (float, optional): How long a count may be reused. Defaults to 5s.
 
     Returns:
         dict: {
@@ -88,174 +495,332 @@ def count_records_by_pipeline_status(
             "row_count": int
         }
 
+    Raises:
+        RuntimeError: On execution failure.
+    """
+    cache_key = ("count", database, schema, table_name, pipeline_status)
+
+    cached = _status_cache_get(cache_key, cache_ttl_seconds)
+    if cached is not None:
+        return cached
+
+    result = count_records_grouped_by_status(
+        table_name=table_name,
+        database=database,
+        schema=schema,
+        statuses=[pipeline_status],
+        snowflake_client=snowflake_client,
+        logger=logger
+    )
+
+    return _status_cache_put(cache_key, {
+        "query_id": result["query_id"],
+        "row_count": result["counts"][pipeline_status]
+    })
+
+
+def count_records_grouped_by_status(
+    table_name: str,
+    database: str,
+    schema: str,
+    statuses: list,
+    snowflake_client: SnowflakeQueryClient,
+    logger: LogBlock
+) -> dict:
+    """
+    Counts records for several pipeline_status values with one GROUP BY query.
+
+    Use this instead of calling count_records_by_pipeline_status once per
+    status; all counts come back in a single round-trip.
+
+    Args:
+        table_name (str): Target table name.
+        database (str): Snowflake database name.
+        schema (str): Snowflake schema name.
+        statuses (list[str]): Status values to count (e.g., ['pending', 'failed']).
+        snowflake_client (SnowflakeQueryClient): Active Snowflake client.
+        logger (LogBlock): Project-standard logging instance.
+
+    Returns:
+        dict: {
+            "query_id": str,
+            "counts": dict[str, int]  # every requested status, 0 when absent
+        }
+
     Raises:
         RuntimeError: On execution failure.
     """
     key = "COUNT_PIPELINE_STATUS"
-    query = f"SELECT COUNT(*) FROM {table_name} WHERE pipeline_status = %(pipeline_status)s"
+    query = _render_sql(_COUNT_GROUPED_BY_STATUS_SQL, _qualified_table(database, schema, table_name))
 
-    logger.info(
+    logger.debug_lazy(
         key=key,
-        message=(
-            f"STATUS: STARTED\n"
-            f"PARAMS: pipeline_status = '{pipeline_status}'\n"
-            f"QUERY:\n{query}"
-        )
+        message_factory=lambda: _MSG_COUNT_STARTED % (statuses, query)
     )
 
     try:
-        result = snowflake_client.execute_scalar_query(
+        result = snowflake_client.fetch_all_rows_as_tuples(
             query=query,
-            database=database,
-            schema=schema,
-            query_params={"pipeline_status": pipeline_status}
+            database=None,
+            schema=None,
+            query_params={"statuses": list(statuses)}
         )
 
-        logger.info(
+        counts = {status: 0 for status in statuses}
+        counts.update(result.data)
+
+        logger.info_lazy(
             key=key,
-            message=(
-                f"STATUS: COMPLETED\n"
-                f"COUNT: {result['data']}\n"
-                f"QUERY ID: {result['query_id']}\n"
-                f"QUERY:\n{query}"
-            )
+            message_factory=lambda: _MSG_COUNT_COMPLETED % (counts, result.query_id, _sql_digest(query))
         )
 
         return {
-            "query_id": result["query_id"],
-            "row_count": result["data"]
+            "query_id": result.query_id,
+            "counts": counts
         }
 
     except Exception as error:
         logger.error(
             key=key,
-            message=(
-                f"STATUS: FAILED\n"
-                f"ERROR: {error}\n"
-                f"QUERY:\n{query}"
-            )
+            message=_MSG_COUNT_FAILED % (error, query)
         )
         raise
 
-def get_oldest_record_by_status(
+
+def count_records_by_pipeline_status_async(
     table_name: str,
     database: str,
     schema: str,
     pipeline_status: str,
     snowflake_client: SnowflakeQueryClient,
-    logger: LogBlock
+    logger: LogBlock,
+    cache_ttl_seconds: float = _STATUS_CACHE_TTL_SECONDS
 ) -> dict:
     """
-    Retrieves the oldest record (by query_window_start_ts) from a table
-    for a specific pipeline_status (e.g., 'pending', 'failed', 'in_progress').
+    Submits the count_records_by_pipeline_status query without waiting for it.
 
-    Timestamp fields are converted to ISO 8601 strings for downstream compatibility.
+    Submit several counts, then resolve them together with await_all() so
+    they run concurrently on the warehouse instead of one after another.
+    A fresh cached count is returned as an already-resolved handle.
 
     Args:
-        table_name (str): Name of the target table.
+        table_name (str): Target table name.
         database (str): Snowflake database name.
         schema (str): Snowflake schema name.
-        pipeline_status (str): Must be one of 'pending', 'failed', 'in_progress'.
-        snowflake_client (SnowflakeQueryClient): Snowflake connection client.
-        logger (LogBlock): Structured logger instance.
+        pipeline_status (str): Filter value (e.g., 'completed').
+        snowflake_client (SnowflakeQueryClient): Active Snowflake client.
+        logger (LogBlock): Project-standard logging instance.
+        cache_ttl_seconds (float, optional): How long a count may be reused. Defaults to 5s.
 
     Returns:
         dict: {
-            "query_id": str,
-            "record": dict or None
+            "query_id": str,          # submitted (or cached) query ID
+            "resolve": callable       # returns {"query_id": str, "row_count": int}
         }
 
     Raises:
-        RuntimeError: If the query fails.
-    """
-    status_key = pipeline_status.upper()
-    key = f"PICK_OLDEST_{status_key}"
-    query = f"""
-        SELECT * FROM {table_name}
-        WHERE pipeline_status = %(pipeline_status)s
-        ORDER BY query_window_start_ts ASC
-        LIMIT 1
+        RuntimeError: If the query cannot be submitted.
     """
+    key = "COUNT_PIPELINE_STATUS"
+    cache_key = ("count", database, schema, table_name, pipeline_status)
+
+    cached = _status_cache_get(cache_key, cache_ttl_seconds)
+    if cached is not None:
+        return {"query_id": cached["query_id"], "resolve": lambda: cached}
 
-    logger.info(
+    query = _render_sql(_COUNT_BY_STATUS_SQL, _qualified_table(database, schema, table_name))
+
+    logger.debug_lazy(
         key=key,
-        message=(
-            f"STATUS: STARTED\n"
-            f"FILTER: pipeline_status = '{pipeline_status}'\n"
-            f"QUERY:\n{query.strip()}"
+        message_factory=lambda: _MSG_COUNT_STARTED % ([pipeline_status], query)
+    )
+
+    try:
+        query_id = snowflake_client.execute_scalar_async(
+            query=query,
+            database=None,
+            schema=None,
+            query_params={"pipeline_status": pipeline_status}
         )
+    except Exception as error:
+        logger.error(
+            key=key,
+            message=_MSG_COUNT_FAILED % (error, query)
+        )
+        raise
+
+    def resolve() -> dict:
+        try:
+            result = snowflake_client.get_scalar_result(query_id)
+        except Exception as error:
+            logger.error(
+                key=key,
+                message=_MSG_COUNT_FAILED % (error, query)
+            )
+            raise
+        counts = {pipeline_status: result.data or 0}
+        logger.info_lazy(
+            key=key,
+            message_factory=lambda: _MSG_COUNT_COMPLETED % (counts, query_id, _sql_digest(query))
+        )
+        return _status_cache_put(cache_key, {
+            "query_id": query_id,
+            "row_count": counts[pipeline_status]
+        })
+
+    return {"query_id": query_id, "resolve": resolve}
+
+
+def await_all(handles: list) -> list:
+    """
+    Resolves handles from the *_async helpers, in order.
+
+    Every query was already submitted, so waiting on them one after another
+    costs roughly the slowest query rather than the sum of all of them.
+
+    Args:
+        handles (list[dict]): Handles returned by e.g. count_records_by_pipeline_status_async.
+
+    Returns:
+        list[dict]: The resolved result of each handle, in the same order.
+
+    Raises:
+        RuntimeError: If any of the queries failed.
+    """
+    return [handle["resolve"]() for handle in handles]
+
+
+def _pick_record_by_status(
+    kind: str,
+    template: str,
+    table_name: str,
+    database: str,
+    schema: str,
+    pipeline_status: str,
+    snowflake_client: SnowflakeQueryClient,
+    logger: LogBlock,
+    cache_ttl_seconds: float
+) -> dict:
+    """
+    Shared body of get_oldest_record_by_status / get_latest_record_by_status.
+
+    `kind` ('oldest' or 'latest') names the log key and status-cache slot;
+    `template` is the matching ORDER BY ... LIMIT 1 query.
+    """
+    key = _PICK_KEYS.get((kind, pipeline_status)) or f"PICK_{kind.upper()}_{pipeline_status.upper()}"
+    cache_key = (kind, database, schema, table_name, pipeline_status)
+
+    cached = _status_cache_get(cache_key, cache_ttl_seconds)
+    if cached is not None:
+        return cached
+
+    query = _render_sql(template, _qualified_table(database, schema, table_name))
+
+    logger.debug_lazy(
+        key=key,
+        message_factory=lambda: _MSG_PICK_STARTED % (pipeline_status, query)
     )
 
     try:
-        result = snowflake_client.fetch_all_rows_as_dataframe(
+        result = snowflake_client.fetch_one_row_as_dict(
             query=query,
-            database=database,
-            schema=schema,
+            database=None,
+            schema=None,
             query_params={"pipeline_status": pipeline_status}
         )
 
-        df = result["data"]
-        query_id = result["query_id"]
+        row = result.data
+        query_id = result.query_id
 
-        if df.empty:
-            logger.info(
+        if row is None:
+            logger.info_lazy(
                 key=key,
-                message=(
-                    f"STATUS: COMPLETED\n"
-                    f"QUERY ID: {query_id}\n"
-                    f"RESULT: No matching records\n"
-                    f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                    f"QUERY:\n{query.strip()}"
-                )
+                message_factory=lambda: _MSG_PICK_NO_RECORD % (query_id, pipeline_status, _sql_digest(query))
             )
-            return {"query_id": query_id, "record": None}
+            return _status_cache_put(cache_key, {"query_id": query_id, "record": None})
 
-        record_dict = {
-            col: val.isoformat() if isinstance(val, datetime) else val
-            for col, val in df.iloc[0].items()
-        }
+        record_dict = _isoformat_datetimes(row)
 
-        logger.info(
+        logger.info_lazy(
             key=key,
-            message=(
-                f"STATUS: COMPLETED\n"
-                f"QUERY ID: {query_id}\n"
-                f"RECORD PICKED:\n{record_dict}\n"
-                f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                f"QUERY:\n{query.strip()}"
-            )
+            message_factory=lambda: _MSG_PICK_COMPLETED % (query_id, record_dict, pipeline_status, _sql_digest(query))
         )
 
-        return {
+        return _status_cache_put(cache_key, {
             "query_id": query_id,
             "record": record_dict
-        }
+        })
 
     except Exception as error:
         logger.error(
             key=key,
-            message=(
-                f"STATUS: FAILED\n"
-                f"ERROR: {error}\n"
-                f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                f"QUERY:\n{query.strip()}"
-            )
+            message=_MSG_PICK_FAILED % (error, pipeline_status, query)
         )
         raise
 
+
+def get_oldest_record_by_status(
+    table_name: str,
+    database: str,
+    schema: str,
+    pipeline_status: str,
+    snowflake_client: SnowflakeQueryClient,
+    logger: LogBlock,
+    cache_ttl_seconds: float = _STATUS_CACHE_TTL_SECONDS
+) -> dict:
+    """
+    Retrieves the oldest record (by query_window_start_ts) from a table
+    for a specific pipeline_status (e.g., 'pending', 'failed', 'in_progress').
+
+    Timestamp fields are converted to ISO 8601 strings for downstream compatibility.
+    Picked records are reused for `cache_ttl_seconds`; see invalidate_status_cache().
+
+    Args:
+        table_name (str): Name of the target table.
+        database (str): Snowflake database name.
+        schema (str): Snowflake schema name.
+        pipeline_status (str): Must be one of 'pending', 'failed', 'in_progress'.
+        snowflake_client (SnowflakeQueryClient): Snowflake connection client.
+        logger (LogBlock): Structured logger instance.
+        cache_ttl_seconds (float, optional): How long a picked record may be reused. Defaults to 5s.
+
+    Returns:
+        dict: {
+            "query_id": str,
+            "record": dict or None
+        }
+
+    Raises:
+        RuntimeError: If the query fails.
+    """
+    return _pick_record_by_status(
+        kind="oldest",
+        template=_OLDEST_BY_STATUS_SQL,
+        table_name=table_name,
+        database=database,
+        schema=schema,
+        pipeline_status=pipeline_status,
+        snowflake_client=snowflake_client,
+        logger=logger,
+        cache_ttl_seconds=cache_ttl_seconds
+    )
+
+
 def get_latest_record_by_status(
     table_name: str,
     database: str,
     schema: str,
     pipeline_status: str,
     snowflake_client: SnowflakeQueryClient,
-    logger: LogBlock
+    logger: LogBlock,
+    cache_ttl_seconds: float = _STATUS_CACHE_TTL_SECONDS
 ) -> dict:
     """
     Retrieves the latest record (by query_window_start_ts DESC)
     from a table for a given pipeline_status.
 
     Datetime fields are converted to ISO 8601 strings for compatibility.
+    Picked records are reused for `cache_ttl_seconds`; see invalidate_status_cache().
 
     Args:
         table_name (str): Table to query.
@@ -264,6 +829,7 @@ def get_latest_record_by_status(
         pipeline_status (str): Filter value (e.g., 'completed', 'failed').
         snowflake_client (SnowflakeQueryClient): Shared connection client.
         logger (LogBlock): Logger instance.
+        cache_ttl_seconds (float, optional): How long a picked record may be reused. Defaults to 5s.
 
     Returns:
         dict: {
@@ -274,61 +840,209 @@ def get_latest_record_by_status(
     Raises:
         RuntimeError: On query failure.
     """
-    status_key = pipeline_status.upper()
-    key = f"PICK_LATEST_{status_key}"
-    query = f"""
-        SELECT * FROM {table_name}
-        WHERE pipeline_status = %(pipeline_status)s
-        ORDER BY query_window_start_ts DESC
-        LIMIT 1
+    return _pick_record_by_status(
+        kind="latest",
+        template=_LATEST_BY_STATUS_SQL,
+        table_name=table_name,
+        database=database,
+        schema=schema,
+        pipeline_status=pipeline_status,
+        snowflake_client=snowflake_client,
+        logger=logger,
+        cache_ttl_seconds=cache_ttl_seconds
+    )
+
+
+def get_pipeline_status_snapshot(
+    table_name: str,
+    database: str,
+    schema: str,
+    snowflake_client: SnowflakeQueryClient,
+    logger: LogBlock,
+    oldest_statuses: tuple = (),
+    latest_statuses: tuple = (),
+    count_statuses: tuple = ()
+) -> dict:
     """
+    Fetches oldest/latest records and counts for several statuses in one round-trip.
 
-    logger.info(
-        key=key,
-        message=(
-            f"STATUS: STARTED\n"
-            f"FILTER: pipeline_status = '{pipeline_status}'\n"
-            f"QUERY:\n{query.strip()}"
+    All lookups are sent as a single multi-statement request, reusing the same
+    SQL as get_oldest_record_by_status, get_latest_record_by_status and
+    count_records_grouped_by_status. Each answer is also stored in the status
+    cache, so those helpers called afterwards in the same scheduler tick are
+    served locally instead of querying Snowflake again.
+
+    Args:
+        table_name (str): Target table name.
+        database (str): Snowflake database name.
+        schema (str): Snowflake schema name.
+        snowflake_client (SnowflakeQueryClient): Active Snowflake client.
+        logger (LogBlock): Project-standard logging instance.
+        oldest_statuses (tuple[str]): Statuses to pick the oldest record for.
+        latest_statuses (tuple[str]): Statuses to pick the latest record for.
+        count_statuses (tuple[str]): Statuses to count.
+
+    Returns:
+        dict: {
+            "query_id": str,
+            "oldest": dict[str, dict or None],
+            "latest": dict[str, dict or None],
+            "counts": dict[str, int]
+        }
+
+    Raises:
+        RuntimeError: On execution failure.
+    """
+    key = "PIPELINE_STATUS_SNAPSHOT"
+    table = _qualified_table(database, schema, table_name)
+
+    statements = []
+    query_params = {}
+    lookups = [("oldest", status) for status in oldest_statuses]
+    lookups += [("latest", status) for status in latest_statuses]
+    for i, (kind, status) in enumerate(lookups):
+        template = _OLDEST_BY_STATUS_SQL if kind == "oldest" else _LATEST_BY_STATUS_SQL
+        statements.append(
+            _render_sql(template, table).replace("%(pipeline_status)s", f"%(status_{i})s")
         )
+        query_params[f"status_{i}"] = status
+    if count_statuses:
+        statements.append(_render_sql(_COUNT_GROUPED_BY_STATUS_SQL, table))
+        query_params["statuses"] = list(count_statuses)
+
+    snapshot = {"query_id": None, "oldest": {}, "latest": {}, "counts": {}}
+    if not statements:
+        return snapshot
+
+    query = ";\n".join(statements)
+
+    logger.debug_lazy(
+        key=key,
+        message_factory=lambda: f"STATUS: STARTED\nPARAMS: {query_params}\nQUERY:\n{query}"
     )
 
     try:
-        result = snowflake_client.fetch_all_rows_as_dataframe(
+        result = snowflake_client.execute_multi_statement(
             query=query,
-            database=database,
-            schema=schema,
-            query_params={"pipeline_status": pipeline_status}
+            database=None,
+            schema=None,
+            num_statements=len(statements),
+            query_params=query_params
         )
-
-        df = result["data"]
         query_id = result["query_id"]
-
-        if df.empty:
-            logger.info(
-                key=key,
-                message=(
-                    f"STATUS: COMPLETED\n"
-                    f"QUERY ID: {query_id}\n"
-                    f"RESULT: No matching records\n"
-                    f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                    f"QUERY:\n{query.strip()}"
+        snapshot["query_id"] = query_id
+
+        for (kind, status), statement_result in zip(lookups, result["results"]):
+            rows = statement_result["rows"]
+            record_dict = _isoformat_datetimes(rows[0]) if rows else None
+            snapshot[kind][status] = _status_cache_put(
+                (kind, database, schema, table_name, status),
+                {"query_id": query_id, "record": record_dict}
+            )["record"]
+
+        if count_statuses:
+            counts = {status: 0 for status in count_statuses}
+            counts.update(tuple(row.values()) for row in result["results"][-1]["rows"])
+            snapshot["counts"] = counts
+            for status, row_count in counts.items():
+                _status_cache_put(
+                    ("count", database, schema, table_name, status),
+                    {"query_id": query_id, "row_count": row_count}
                 )
+
+        logger.info_lazy(
+            key=key,
+            message_factory=lambda: (
+                f"STATUS: COMPLETED\n"
+                f"QUERY ID: {query_id}\n"
+                f"STATEMENTS: {len(statements)}\n"
+                f"COUNTS: {snapshot['counts']}\n"
+                f"QUERY DIGEST: {_sql_digest(query)}"
             )
-            return {"query_id": query_id, "record": None}
+        )
+
+        return snapshot
 
-        record_dict = {
-            col: val.isoformat() if isinstance(val, datetime) else val
-            for col, val in df.iloc[0].items()
+    except Exception as error:
+        logger.error(
+            key=key,
+            message=f"STATUS: FAILED\nERROR: {error}\nQUERY:\n{query}"
+        )
+        raise
+
+
+def claim_oldest_pending_record(
+    table_name: str,
+    database: str,
+    schema: str,
+    snowflake_client: SnowflakeQueryClient,
+    logger: LogBlock
+) -> dict:
+    """
+    Atomically picks the oldest 'pending' record and marks it 'in_progress'.
+
+    Replaces the get_oldest_record_by_status + UPDATE pair with a single
+    transaction sent in one round-trip, which also closes the race where two
+    workers pick the same record. The status cache for the table is invalidated.
+
+    The claim holds an open transaction and session variables, so it needs a
+    session of its own: give the client a pool_size. Without a pool, claims are
+    serialised on the shared connection, but other queries running on it at the
+    same time can still end up inside the claim's transaction.
+
+    Args:
+        table_name (str): Name of the target table.
+        database (str): Snowflake database name.
+        schema (str): Snowflake schema name.
+        snowflake_client (SnowflakeQueryClient): Snowflake connection client.
+        logger (LogBlock): Structured logger instance.
+
+    Returns:
+        dict: {
+            "query_id": str,
+            "record": dict or None  # None when nothing was pending or another worker won
         }
 
-        logger.info(
+    Raises:
+        RuntimeError: If the transaction fails (it is rolled back on the same connection).
+    """
+    key = "CLAIM_OLDEST_PENDING"
+    query = _render_sql(_CLAIM_OLDEST_SQL, _qualified_table(database, schema, table_name))
+    query_params = {"from_status": "pending", "to_status": "in_progress"}
+
+    logger.debug_lazy(
+        key=key,
+        message_factory=lambda: (
+            f"STATUS: STARTED\n"
+            f"FILTER: pipeline_status = 'pending' -> 'in_progress'\n"
+            f"QUERY:\n{query}"
+        )
+    )
+
+    try:
+        result = snowflake_client.execute_multi_statement(
+            query=query,
+            database=None,
+            schema=None,
+            num_statements=_CLAIM_OLDEST_STATEMENTS,
+            query_params=query_params,
+            rollback_on_error=True
+        )
+        invalidate_status_cache(table_name)
+
+        update_result, select_result = result["results"][2], result["results"][3]
+        query_id = result["query_id"]
+        record_dict = None
+        if update_result["rowcount"] and select_result["rows"]:
+            record_dict = _isoformat_datetimes(select_result["rows"][0])
+
+        logger.info_lazy(
             key=key,
-            message=(
+            message_factory=lambda: (
                 f"STATUS: COMPLETED\n"
                 f"QUERY ID: {query_id}\n"
-                f"RECORD PICKED:\n{record_dict}\n"
-                f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                f"QUERY:\n{query.strip()}"
+                f"RECORD CLAIMED:\n{record_dict}\n"
+                f"QUERY DIGEST: {_sql_digest(query)}"
             )
         )
 
@@ -343,12 +1057,12 @@ def get_latest_record_by_status(
             message=(
                 f"STATUS: FAILED\n"
                 f"ERROR: {error}\n"
-                f"FILTER: pipeline_status = '{pipeline_status}'\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY:\n{query}"
             )
         )
         raise
 
+
 def get_discontinuous_query_windows(
     day: str,
     pipeline_name: str,
@@ -382,42 +1096,22 @@ def get_discontinuous_query_windows(
     """
     key = "CHECK_DISCONTINUOUS_QUERY_WINDOWS"
 
-    query = f"""
-        WITH ordered_windows AS (
-            SELECT
-                query_window_start_ts,
-                query_window_end_ts,
-                LAG(query_window_end_ts) OVER (
-                    ORDER BY query_window_start_ts
-                ) AS prev_end_ts
-            FROM {table_name}
-            WHERE DATE(query_window_start_ts) = %(day)s
-              AND pipeline_name = %(pipeline_name)s
-              AND index_name = %(index_name)s
-        )
-        SELECT
-            prev_end_ts AS missing_query_window_start_ts,
-            query_window_start_ts AS missing_query_window_end_ts
-        FROM ordered_windows
-        WHERE prev_end_ts IS NOT NULL
-          AND query_window_start_ts != prev_end_ts
-        ORDER BY missing_query_window_start_ts
-    """
+    query = _render_sql(_DISCONTINUOUS_WINDOWS_SQL, _qualified_table(database, schema, table_name))
 
-    logger.info(
+    logger.debug_lazy(
         key=key,
-        message=(
+        message_factory=lambda: (
             f"STATUS: STARTED\n"
             f"FILTER: pipeline_status = 'N/A', pipeline_name = '{pipeline_name}', index_name = '{index_name}', day = '{day}'\n"
-            f"QUERY:\n{query.strip()}"
+            f"QUERY:\n{query}"
         )
     )
 
     try:
-        result = snowflake_client.fetch_all_rows_as_dataframe(
+        result = snowflake_client.fetch_all_rows_as_arrow(
             query=query,
-            database=database,
-            schema=schema,
+            database=None,
+            schema=None,
             query_params={
                 "day": day,
                 "pipeline_name": pipeline_name,
@@ -425,18 +1119,18 @@ def get_discontinuous_query_windows(
             }
         )
 
-        df = result["data"]
-        query_id = result["query_id"]
+        table = result.data
+        query_id = result.query_id
 
-        if df.empty:
-            logger.info(
+        if table.num_rows == 0:
+            logger.info_lazy(
                 key=key,
-                message=(
+                message_factory=lambda: (
                     f"STATUS: COMPLETED\n"
                     f"QUERY ID: {query_id}\n"
                     f"RESULT: Query windows are continuous\n"
                     f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', day = '{day}'\n"
-                    f"QUERY:\n{query.strip()}"
+                    f"QUERY DIGEST: {_sql_digest(query)}"
                 )
             )
             return {
@@ -445,25 +1139,23 @@ def get_discontinuous_query_windows(
                 "discontinuities": []
             }
 
+        # Convert each column once and zip them, instead of building row dicts column by column
         gaps = [
-            {
-                "missing_query_window_start_ts": r["missing_query_window_start_ts"].isoformat()
-                if isinstance(r["missing_query_window_start_ts"], datetime) else r["missing_query_window_start_ts"],
-
-                "missing_query_window_end_ts": r["missing_query_window_end_ts"].isoformat()
-                if isinstance(r["missing_query_window_end_ts"], datetime) else r["missing_query_window_end_ts"]
-            }
-            for _, r in df.iterrows()
+            {"missing_query_window_start_ts": gap_start, "missing_query_window_end_ts": gap_end}
+            for gap_start, gap_end in zip(
+                table.column("missing_query_window_start_ts").to_pylist(),
+                table.column("missing_query_window_end_ts").to_pylist()
+            )
         ]
 
-        logger.info(
+        logger.info_lazy(
             key=key,
-            message=(
+            message_factory=lambda: (
                 f"STATUS: COMPLETED\n"
                 f"QUERY ID: {query_id}\n"
                 f"DISCONTINUITIES FOUND: {len(gaps)}\n"
                 f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', day = '{day}'\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY DIGEST: {_sql_digest(query)}"
             )
         )
 
@@ -480,11 +1172,12 @@ def get_discontinuous_query_windows(
                 f"STATUS: FAILED\n"
                 f"ERROR: {error}\n"
                 f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', day = '{day}'\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY:\n{query}"
             )
         )
         raise
 
+
 def find_overlapping_query_windows(
     client: SnowflakeQueryClient,
     database: str,
@@ -493,13 +1186,17 @@ def find_overlapping_query_windows(
     pipeline_name: str,
     index_name: str,
     date_str: str,
-) -> dict:
+) -> QueryResult:
     """
     Identifies overlapping query windows within a given day for a specific pipeline and index.
 
     A query window is considered overlapping if its time range intersects with another record's window.
     This function helps detect duplicate or conflicting processing ranges.
 
+    Each overlapping window is reported once, paired with the earliest-starting
+    of the earlier windows that extend furthest past its start. Windows sharing the same start
+    are not compared with each other.
+
     Args:
         client (SnowflakeQueryClient): An active SnowflakeQueryClient instance.
         database (str): Target Snowflake database name.
@@ -510,75 +1207,60 @@ def find_overlapping_query_windows(
         date_str (str): Date in 'YYYY-MM-DD' format to define the day being checked.
 
     Returns:
-        dict:
-            {
-                "query_id": str,
-                "data": pd.DataFrame of overlaps (may be empty),
-            }
+        QueryResult:
+            (
+                query_id: str,
+                data: pd.DataFrame of overlaps (may be empty)
+            )
 
     Raises:
         RuntimeError: If query execution fails.
     """
-    logger = LogBlock(logger_name="data_pipeline", max_depth=6)
+    logger = overlap_logger
     key = "FIND_OVERLAPPING_WINDOWS"
 
-    start_ts = f"{date_str} 00:00:00"
-    end_expr = f"DATEADD(day, 1, '{date_str}')"
+    query = _render_sql(_OVERLAPPING_WINDOWS_SQL, _qualified_table(database, schema, table_name))
 
-    logger.log_start(key=key, message=f"Checking overlaps for date: {date_str}")
-
-    query = f"""
-    WITH filtered_day_data AS (
-        SELECT *
-        FROM {table_name}
-        WHERE pipeline_name = %(pipeline_name)s
-          AND index_name = %(index_name)s
-          AND query_window_start_ts < {end_expr}
-          AND query_window_end_ts > '{start_ts}'
+    logger.debug_lazy(
+        key=key,
+        message_factory=lambda: (
+            f"STATUS: STARTED\n"
+            f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', date = '{date_str}'\n"
+            f"QUERY:\n{query}"
+        )
     )
-    SELECT
-        t1.query_window_start_ts AS source_window_start_ts,
-        t1.query_window_end_ts AS source_window_end_ts,
-        t2.query_window_start_ts AS overlaps_with_start_ts,
-        t2.query_window_end_ts AS overlaps_with_end_ts
-    FROM filtered_day_data t1
-    INNER JOIN filtered_day_data t2
-      ON t1.query_window_start_ts < t2.query_window_end_ts
-     AND t1.query_window_end_ts > t2.query_window_start_ts
-     AND t1.query_window_start_ts != t2.query_window_start_ts
-    ORDER BY source_window_start_ts, overlaps_with_start_ts;
-    """
 
     try:
         result = client.fetch_all_rows_as_dataframe(
             query=query,
-            database=database,
-            schema=schema,
+            database=None,
+            schema=None,
             query_params={
                 "pipeline_name": pipeline_name,
-                "index_name": index_name
+                "index_name": index_name,
+                "date": date_str
             }
         )
-        df = result["data"]
-        logger.log_complete(
+        df = result.data
+        logger.info_lazy(
             key=key,
-            message=(
+            message_factory=lambda: (
                 f"STATUS: COMPLETED\n"
-                f"QUERY ID: {result['query_id']}\n"
+                f"QUERY ID: {result.query_id}\n"
                 f"RECORDS FOUND: {len(df)}\n"
                 f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', date = '{date_str}'\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY DIGEST: {_sql_digest(query)}"
             )
         )
         return result
     except Exception as e:
-        logger.log_failure(
+        logger.error(
             key=key,
             message=(
                 f"STATUS: FAILED\n"
                 f"FILTER: pipeline_name = '{pipeline_name}', index_name = '{index_name}', date = '{date_str}'\n"
                 f"ERROR: {str(e)}\n"
-                f"QUERY:\n{query.strip()}"
+                f"QUERY:\n{query}"
             )
         )
         raise
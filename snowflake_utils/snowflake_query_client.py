@@ -1,6 +1,120 @@
 import snowflake.connector
-from typing import Optional, Any
+from snowflake.connector import DictCursor
+import hashlib
+import json
+import queue
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import Optional, Any, Callable, Iterator, NamedTuple
 import pandas as pd
+import pyarrow as pa
+
+# One client (and therefore one open connection) per set of credentials,
+# shared by every snowflake_session() in the process.
+_SESSION_POOL: dict = {}
+_SESSION_POOL_LOCK = threading.Lock()
+
+# Database/schema names accepted by _use_context: plain identifiers, or
+# already-quoted ones ("My Db", with embedded quotes doubled).
+_IDENT_RE = re.compile(r'^(?:[A-Za-z_][A-Za-z0-9_$]{0,254}|"(?:[^"]|""){1,255}")$')
+
+# A USE statement anywhere in a batch; the session context is no longer known after it.
+_USE_STATEMENT_RE = re.compile(r"(?:^|;)\s*USE\s", re.IGNORECASE)
+
+# Backoff bounds (seconds) when polling the status of async queries.
+_ASYNC_POLL_INITIAL_DELAY = 0.05
+_ASYNC_POLL_MAX_DELAY = 2.0
+
+# Per-client result cache bound; the oldest entry is evicted beyond this.
+_RESULT_CACHE_MAXSIZE = 256
+# Distinct query texts counted before the repeat counter starts over.
+_SEEN_QUERIES_MAXSIZE = 4096
+
+# Target table of INSERT/UPDATE/DELETE/MERGE/TRUNCATE/COPY statements, used to
+# drop cached reads of that table after a write.
+_DML_TABLE_RE = re.compile(
+    r"\b(?:INSERT\s+(?:OVERWRITE\s+)?INTO|UPDATE|DELETE\s+FROM|MERGE\s+INTO|TRUNCATE(?:\s+TABLE)?|COPY\s+INTO)\s+([A-Za-z0-9_$.\"]+)",
+    re.IGNORECASE
+)
+
+_PYFORMAT_PLACEHOLDER_RE = re.compile(r"%\((\w+)\)s")
+
+
+@lru_cache(maxsize=256)
+def _split_pyformat(query: str) -> tuple:
+    """
+    Splits a %(name)s-style query into its literal SQL pieces and placeholder names.
+
+    Cached per query text, so the regex runs once per distinct query.
+    """
+    pieces = _PYFORMAT_PLACEHOLDER_RE.split(query)
+    literals = tuple(piece.replace("%%", "%") for piece in pieces[0::2])
+    return literals, tuple(pieces[1::2])
+
+
+@lru_cache(maxsize=64)
+def _use_sql(kind: str, name: str) -> str:
+    """
+    Returns the validated `USE DATABASE|SCHEMA <name>` statement, once per name.
+
+    USE cannot take a bind parameter, so the name is checked against _IDENT_RE
+    before it is spliced in. Unquoted names are kept unquoted so Snowflake
+    still resolves them case-insensitively.
+
+    Raises:
+        ValueError: If `name` is not a valid identifier.
+    """
+    if not _IDENT_RE.match(name):
+        raise ValueError(f"Invalid {kind.lower()} name: {name!r}")
+    return f"USE {kind} {name}"
+
+
+def _to_qmark(query: str, query_params: dict) -> tuple:
+    """
+    Rewrites a %(name)s-style query and its dict params for server-side (qmark) binding.
+
+    List/tuple values expand to one `?` per element, as client-side binding does
+    for `IN (%(values)s)`.
+
+    Returns:
+        tuple: (query with `?` placeholders, list of values in placeholder order)
+    """
+    literals, names = _split_pyformat(query)
+    parts = [literals[0]]
+    values = []
+    for name, literal in zip(names, literals[1:]):
+        value = query_params[name]
+        if isinstance(value, (list, tuple)):
+            parts.append(", ".join("?" * len(value)))
+            values.extend(value)
+        else:
+            parts.append("?")
+            values.append(value)
+        parts.append(literal)
+    return "".join(parts), values
+
+
+class QueryResult(NamedTuple):
+    """
+    Query ID and result of a read query.
+
+    Lighter than a dict and read as `result.query_id` / `result.data`.
+    `result["query_id"]` and `result["data"]` keep working for existing callers.
+    """
+    query_id: str
+    data: Any
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
 
 
 class SnowflakeQueryClient:
@@ -14,6 +128,7 @@ class SnowflakeQueryClient:
         - Full result tables as a Pandas DataFrame or list of tuples
     - Supports parameterized queries via Python dict input
     - Returns Snowflake query ID with each query for traceability
+    - Optionally pools connections (pool_size) for concurrent callers
 
      Usage Example:
 
@@ -45,6 +160,11 @@ class SnowflakeQueryClient:
         )
         print(df_result["data"].head())
 
+        # Reuse one authenticated connection across pipeline tasks
+        with snowflake_session(account=..., user=..., password=..., role=...,
+                               warehouse=..., database=..., schema=...) as client:
+            count_records_by_pipeline_status(..., snowflake_client=client, ...)
+
     """
 
     def __init__(
@@ -55,12 +175,17 @@ class SnowflakeQueryClient:
         role: str,
         warehouse: str,
         database: str,
-        schema: str
+        schema: str,
+        cache_ttl: float = 0.0,
+        pool_size: Optional[int] = None,
+        pool_timeout: float = 120.0,
+        server_side_binding: bool = False,
+        max_concurrent: int = 8
     ):
         """
         Initializes connection credentials for Snowflake.
 
-        🔐 All parameters are required to establish the connection.
+        🔐 All connection parameters are required to establish the connection.
 
         Args:
             account (str): Snowflake account identifier (e.g., 'xy12345.ap-south-1').
@@ -70,6 +195,19 @@ class SnowflakeQueryClient:
             warehouse (str): Virtual warehouse to execute queries.
             database (str): Default database (can be overridden per query).
             schema (str): Default schema (can be overridden per query).
+            cache_ttl (float, optional): Seconds a cacheable read result may be reused.
+                Defaults to 0 (no result caching).
+            pool_size (int, optional): Keep up to this many connections and hand one
+                to each concurrent query. Defaults to None: every query shares
+                a single connection.
+            pool_timeout (float, optional): Seconds to wait for a free pooled
+                connection before failing. Defaults to 120.
+            server_side_binding (bool, optional): Send bind values to Snowflake
+                separately (qmark paramstyle) instead of splicing them into the
+                SQL text client-side, so repeated query shapes share one text.
+                Queries keep using %(name)s placeholders. Defaults to False.
+            max_concurrent (int, optional): Upper bound on queries execute_many runs
+                at once. Defaults to 8.
         """
         self.account = account
         self.user = user
@@ -79,6 +217,27 @@ class SnowflakeQueryClient:
         self.database = database
         self.schema = schema
         self.connection: Optional[Any] = None
+        self.cache_ttl = cache_ttl
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.server_side_binding = server_side_binding
+        self.max_concurrent = max_concurrent
+        # Idle pooled connections (most recently used first) and how many exist
+        self._pool: Optional[queue.LifoQueue] = queue.LifoQueue() if pool_size else None
+        self._pool_created = 0
+        self._pool_lock = threading.Lock()
+        # Connection borrowed by the current thread, so nested calls reuse it
+        self._local = threading.local()
+        # Serialises rollback_on_error multi-statements on the shared connection when unpooled
+        self._transaction_lock = threading.Lock()
+        # blake2b(query, database, schema, params) -> (stored_at, query, QueryResult)
+        self._result_cache: dict = {}
+        # Times each query text was seen; results are only cached from the second run
+        self._seen_queries: Counter = Counter()
+        # Guards _result_cache and _seen_queries; execute_many reads them from several threads
+        self._cache_lock = threading.Lock()
+        # Optional (query, params) -> value hook consulted by execute_scalar_query
+        self._predictor: Optional[Callable[[str, dict], Any]] = None
 
     def _create_snowflake_connection(self) -> Any:
         """
@@ -98,8 +257,16 @@ class SnowflakeQueryClient:
                 role=self.role,
                 warehouse=self.warehouse,
                 database=self.database,
-                schema=self.schema
+                schema=self.schema,
+                paramstyle="qmark" if self.server_side_binding else "pyformat",
+                # Sent with the login request, so it costs no extra round-trip
+                autocommit=True
             )
+            # (database, schema, warehouse) this session was last switched to by _use_context
+            conn._session_context = (None, None, None)
+            # Reusable cursors by cursor class; see _cursor()
+            conn._shared_cursors = {}
+            conn._cursor_lock = threading.Lock()
             return conn
         except Exception as error:
             raise ConnectionError(f"Failed to connect to Snowflake: {error}")
@@ -115,13 +282,314 @@ class SnowflakeQueryClient:
             self.connection = self._create_snowflake_connection()
         return self.connection
 
+    def _borrow_pooled_connection(self) -> Any:
+        """
+        Takes an idle pooled connection, opening a new one while under pool_size.
+
+        Raises:
+            ConnectionError: If no connection frees up within pool_timeout.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_create = self._pool_created < self.pool_size
+                if can_create:
+                    self._pool_created += 1
+            if can_create:
+                try:
+                    return self._create_snowflake_connection()
+                except Exception:
+                    with self._pool_lock:
+                        self._pool_created -= 1
+                    raise
+            try:
+                conn = self._pool.get(timeout=self.pool_timeout)
+            except queue.Empty:
+                raise ConnectionError(
+                    f"No pooled Snowflake connection became free within {self.pool_timeout}s"
+                )
+        if conn.is_closed():
+            try:
+                return self._create_snowflake_connection()
+            except Exception:
+                with self._pool_lock:
+                    self._pool_created -= 1
+                raise
+        return conn
+
+    def _bind_params(self, query: str, query_params: Optional[dict]) -> tuple:
+        """
+        Returns the (query, params) pair to pass to cursor.execute.
+
+        With server_side_binding the %(name)s placeholders are rewritten to `?`
+        and the values passed positionally; otherwise both pass through.
+        """
+        if not self.server_side_binding:
+            return query, query_params or {}
+        if not query_params:
+            return query, None
+        return _to_qmark(query, query_params)
+
+    @contextmanager
+    def _connection(self):
+        """
+        Yields the connection a query should run on.
+
+        Without a pool this is the shared get_active_connection(). With one, a
+        connection is borrowed for the block and returned afterwards; nested
+        blocks on the same thread (e.g. inside session_scope) reuse it.
+        """
+        if self._pool is None:
+            yield self.get_active_connection()
+            return
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._borrow_pooled_connection()
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            self._pool.put(conn)
+
+    @contextmanager
+    def _cursor(self, conn: Any, cursor_class: Optional[type] = None):
+        """
+        Yields a cursor on `conn`, reusing one per cursor class instead of opening a new one per query.
+
+        A shared cursor is used by one caller at a time; if another thread
+        already holds it, a throwaway cursor is opened so callers sharing the
+        connection never wait on each other. Shared cursors are closed with
+        their connection.
+        """
+        if not conn._cursor_lock.acquire(blocking=False):
+            with conn.cursor(cursor_class) if cursor_class else conn.cursor() as cursor:
+                yield cursor
+            return
+        try:
+            cursor = conn._shared_cursors.get(cursor_class)
+            if cursor is None or cursor.is_closed():
+                cursor = conn.cursor(cursor_class) if cursor_class else conn.cursor()
+                conn._shared_cursors[cursor_class] = cursor
+            yield cursor
+        finally:
+            conn._cursor_lock.release()
+
+    def _use_context(
+        self,
+        cursor: Any,
+        database: Optional[str],
+        schema: Optional[str],
+        warehouse: Optional[str] = None
+    ) -> None:
+        """
+        Switches the session to the given database/schema (and warehouse, if given).
+
+        Pass None for database/schema when the query uses fully-qualified
+        database.schema.table names to avoid the extra USE round-trips, and
+        None for warehouse to keep the connection's warehouse.
+        When several are needed they go to Snowflake in one request.
+        The context each connection is in is remembered, so statements that
+        would not change it are skipped. Names are validated before use; an
+        invalid one raises ValueError (reported as RuntimeError by the
+        execute_* / fetch_* methods).
+        """
+        current = getattr(cursor.connection, "_session_context", (None, None, None))
+        statements = []
+        if warehouse is not None and warehouse != current[2]:
+            statements.append(_use_sql("WAREHOUSE", warehouse))
+            current = (current[0], current[1], warehouse)
+        if database is not None and database != current[0]:
+            statements.append(_use_sql("DATABASE", database))
+            # USE DATABASE also resets the current schema
+            current = (database, None, current[2])
+        if schema is not None and schema != current[1]:
+            statements.append(_use_sql("SCHEMA", schema))
+            current = (current[0], schema, current[2])
+        if len(statements) == 1:
+            cursor.execute(statements[0])
+        elif statements:
+            cursor.execute(";\n".join(statements), num_statements=len(statements))
+        cursor.connection._session_context = current
+
+    @staticmethod
+    def _forget_context_if_switched(cursor: Any, query: str) -> None:
+        """
+        Drops the remembered context after a caller's own USE statement.
+        """
+        if _USE_STATEMENT_RE.search(query):
+            cursor.connection._session_context = (None, None, None)
+
+    @contextmanager
+    def session_scope(self, database: str, schema: str, warehouse: Optional[str] = None):
+        """
+        Switches the session to database/schema (and warehouse) once for a block of queries.
+
+        Each connection remembers its current database/schema, so execute_*
+        calls for the same context skip their USE statements anyway; the scope
+        switches up front and, with a connection pool, keeps one connection
+        (and so one session context) for this thread for the whole block.
+
+        Usage:
+            with client.session_scope("MY_DB", "PUBLIC"):
+                client.execute_scalar_query(query1, "MY_DB", "PUBLIC")
+                client.fetch_all_rows_as_tuples(query2, "MY_DB", "PUBLIC")
+
+        Args:
+            database (str): Database to switch into.
+            schema (str): Schema to switch into.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Yields:
+            SnowflakeQueryClient: This client.
+        """
+        with self._connection() as conn:
+            with self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+            yield self
+
+    @staticmethod
+    def _result_cache_key(
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict]
+    ) -> str:
+        raw = "|".join((
+            query.strip(),
+            database or "",
+            schema or "",
+            json.dumps(query_params or {}, sort_keys=True, default=str)
+        ))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _is_repeat_query(self, query: str) -> bool:
+        """
+        Counts `query` and returns True from its second occurrence on.
+
+        One-shot queries then never pay for hashing the cache key or storing
+        a result that would not be read again.
+        """
+        with self._cache_lock:
+            if len(self._seen_queries) >= _SEEN_QUERIES_MAXSIZE and query not in self._seen_queries:
+                self._seen_queries.clear()
+            self._seen_queries[query] += 1
+            return self._seen_queries[query] >= 2
+
+    def _cache_get(self, cache_key: str) -> Optional[QueryResult]:
+        """
+        Returns a fresh cached result, or None.
+
+        Hits report `query_id="cached:<original query id>"`.
+        """
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is None or time.monotonic() - cached[0] >= self.cache_ttl:
+            return None
+        result = cached[2]
+        data = list(result.data) if isinstance(result.data, list) else result.data
+        return QueryResult(query_id=f"cached:{result.query_id}", data=data)
+
+    def _cache_put(self, cache_key: str, query: str, result: QueryResult) -> None:
+        data = list(result.data) if isinstance(result.data, list) else result.data
+        with self._cache_lock:
+            self._result_cache.pop(cache_key, None)
+            self._result_cache[cache_key] = (time.monotonic(), query, result._replace(data=data))
+            if len(self._result_cache) > _RESULT_CACHE_MAXSIZE:
+                self._result_cache.pop(next(iter(self._result_cache)), None)
+
+    def register_predictor(self, predictor: Optional[Callable[[str, dict], Any]]) -> None:
+        """
+        Installs a hook that can answer scalar queries without contacting Snowflake.
+
+        execute_scalar_query calls `predictor(query, query_params)` first; any
+        non-None return value is used as the result (query_id "cached:predictor").
+        Calls made with cacheable=False skip the predictor and always query.
+        Return None to let the query run. Typical use: answer per-partition
+        COUNT(*) checks from a single GROUP BY fetched beforehand.
+
+        Args:
+            predictor (callable, optional): The hook, or None to remove it.
+        """
+        self._predictor = predictor
+
+    def invalidate(self, pattern: Optional[str] = None) -> None:
+        """
+        Drops cached read results.
+
+        Args:
+            pattern (str, optional): Only drop results whose SQL contains this
+                text (case-insensitive), e.g. a table name. None drops everything.
+        """
+        with self._cache_lock:
+            if pattern is None:
+                self._result_cache.clear()
+                return
+            needle = pattern.upper()
+            stale = [
+                cache_key for cache_key, (_, query, _) in self._result_cache.items()
+                if needle in query.upper()
+            ]
+            for cache_key in stale:
+                self._result_cache.pop(cache_key, None)
+
+    def _invalidate_written_tables(self, query: str, clear_if_unmatched: bool = True) -> None:
+        """
+        Drops cached reads of every table a DML statement writes to.
+
+        When no target table is recognised the whole cache is cleared, unless
+        `clear_if_unmatched` is False (for batches that may be read-only).
+        """
+        if not self._result_cache:
+            return
+        tables = _DML_TABLE_RE.findall(query)
+        if not tables:
+            if clear_if_unmatched:
+                self.invalidate()
+            return
+        for table in tables:
+            self.invalidate(table.replace('"', "").rsplit(".", 1)[-1])
+
+    def close(self) -> None:
+        """
+        Closes the underlying Snowflake connection(s), if any are open.
+
+        Pooled connections currently borrowed by another thread are not closed.
+        """
+        if self.connection is not None and not self.connection.is_closed():
+            self.connection.close()
+        self.connection = None
+        if self._pool is not None:
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                with self._pool_lock:
+                    self._pool_created -= 1
+                if not conn.is_closed():
+                    conn.close()
+
+    def __enter__(self) -> "SnowflakeQueryClient":
+        with self._connection():
+            pass
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def execute_scalar_query(
         self,
         query: str,
-        database: str,
-        schema: str,
-        query_params: Optional[dict] = None
-    ) -> dict:
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        cacheable: bool = True,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
         """
         Executes a query that returns a single scalar value (e.g., COUNT, MAX, SUM).
 
@@ -131,42 +599,217 @@ class SnowflakeQueryClient:
 
         Args:
             query (str): SQL query string with optional named placeholders (e.g., %(status)s).
-            database (str): Database to use for this query.
-            schema (str): Schema to use for this query.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
             query_params (dict, optional): Key-value pairs to bind to placeholders.
+            cacheable (bool, optional): Reuse a result cached within `cache_ttl` or answered
+                by the registered predictor. Defaults to True.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
 
         Returns:
-            dict:
-                {
-                    "query_id": str,  # Snowflake-assigned query ID
-                    "data": scalar result or None
-                }
+            QueryResult:
+                (
+                    query_id: str,  # Snowflake-assigned query ID, "cached:<id>" on a cache hit,
+                                    # "cached:predictor" when the predictor answered
+                    data: scalar result or None
+                )
 
         Raises:
             RuntimeError: If execution fails or query is invalid.
         """
-        conn = self.get_active_connection()
+        if cacheable and self._predictor is not None:
+            predicted = self._predictor(query, query_params or {})
+            if predicted is not None:
+                return QueryResult(query_id="cached:predictor", data=predicted)
+
+        use_cache = cacheable and self.cache_ttl > 0 and self._is_repeat_query(query)
+        if use_cache:
+            cache_key = self._result_cache_key(query, database, schema, query_params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            with conn.cursor() as cursor:
-                cursor.execute(f"USE DATABASE {database}")
-                cursor.execute(f"USE SCHEMA {schema}")
-                cursor.execute(query, query_params or {})
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
                 query_id = cursor.sfqid
                 result = cursor.fetchone()
-                return {
-                    "query_id": query_id,
-                    "data": result[0] if result else None
-                }
+                query_result = QueryResult(
+                    query_id=query_id,
+                    data=result[0] if result else None
+                )
         except Exception as error:
             raise RuntimeError(f"Failed to execute scalar query: {error}")
 
+        if use_cache:
+            self._cache_put(cache_key, query, query_result)
+        return query_result
+
+    def execute_scalar_async(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None
+    ) -> str:
+        """
+        Submits a scalar query without waiting for it to finish.
+
+        Several queries submitted this way run concurrently on the warehouse;
+        collect each answer later with get_scalar_result(query_id).
+
+        Args:
+            query (str): SQL query string with optional named placeholders.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Key-value pairs to bind to placeholders.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            str: Snowflake query ID of the submitted query.
+
+        Raises:
+            RuntimeError: If the query cannot be submitted.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute_async(*self._bind_params(query, query_params))
+                return cursor.sfqid
+        except Exception as error:
+            raise RuntimeError(f"Failed to submit async scalar query: {error}")
+
+    def get_scalar_result(self, query_id: str) -> QueryResult:
+        """
+        Waits for a query submitted with execute_scalar_async and returns its value.
+
+        Args:
+            query_id (str): Query ID returned by execute_scalar_async.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,
+                    data: scalar result or None
+                )
+
+        Raises:
+            RuntimeError: If the query failed or its result cannot be fetched.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                cursor.get_results_from_sfqid(query_id)
+                result = cursor.fetchone()
+                return QueryResult(
+                    query_id=query_id,
+                    data=result[0] if result else None
+                )
+        except Exception as error:
+            raise RuntimeError(f"Failed to fetch async scalar result: {error}")
+
+    def await_scalar_result(self, query_id: str, timeout: Optional[float] = None) -> QueryResult:
+        """
+        Polls an async query with exponential backoff, then returns its value.
+
+        Unlike get_scalar_result, this does not hold a cursor open inside the
+        connector while the query runs, and can give up after `timeout`.
+
+        Args:
+            query_id (str): Query ID returned by execute_scalar_async.
+            timeout (float, optional): Seconds to wait before giving up. Defaults to no limit.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,
+                    data: scalar result or None
+                )
+
+        Raises:
+            TimeoutError: If the query is still running after `timeout`.
+            RuntimeError: If the query failed or its result cannot be fetched.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = _ASYNC_POLL_INITIAL_DELAY
+        while self._query_still_running(query_id):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Query {query_id} still running after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, _ASYNC_POLL_MAX_DELAY)
+        return self.get_scalar_result(query_id)
+
+    def execute_many_async(self, specs: list) -> list:
+        """
+        Submits several scalar queries at once and collects them as each finishes.
+
+        All queries are submitted before any is waited on, so they compile and
+        run concurrently on the warehouse; total time is roughly the slowest
+        query rather than the sum.
+
+        Each spec is a dict:
+            {
+                "query": str,
+                "database": str or None,
+                "schema": str or None,
+                "params": dict (optional),
+                "warehouse": str (optional)
+            }
+
+        Args:
+            specs (list[dict]): Scalar queries to run.
+
+        Returns:
+            list[QueryResult]: One result per spec, in input order.
+
+        Raises:
+            RuntimeError: If any query fails to submit, run or fetch.
+        """
+        query_ids = [
+            self.execute_scalar_async(
+                query=spec["query"],
+                database=spec.get("database"),
+                schema=spec.get("schema"),
+                query_params=spec.get("params"),
+                warehouse=spec.get("warehouse")
+            )
+            for spec in specs
+        ]
+        results = [None] * len(query_ids)
+        pending = dict(enumerate(query_ids))
+        delay = _ASYNC_POLL_INITIAL_DELAY
+        while pending:
+            finished = [i for i, query_id in pending.items() if not self._query_still_running(query_id)]
+            for i in finished:
+                results[i] = self.get_scalar_result(pending.pop(i))
+            if pending and not finished:
+                time.sleep(delay)
+                delay = min(delay * 2, _ASYNC_POLL_MAX_DELAY)
+        return results
+
+    def _query_still_running(self, query_id: str) -> bool:
+        """
+        Returns whether an async query is still queued or running.
+
+        Raises:
+            RuntimeError: If the query has failed.
+        """
+        try:
+            with self._connection() as conn:
+                return conn.is_still_running(conn.get_query_status_throw_if_error(query_id))
+        except Exception as error:
+            raise RuntimeError(f"Async query {query_id} failed: {error}")
+
     def fetch_all_rows_as_dataframe(
         self,
         query: str,
-        database: str,
-        schema: str,
-        query_params: Optional[dict] = None
-    ) -> dict:
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        arrow_dtypes: bool = False,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
         """
         Executes a query and returns the result as a Pandas DataFrame.
 
@@ -177,42 +820,154 @@ class SnowflakeQueryClient:
 
         Args:
             query (str): SQL query with optional placeholders (e.g., %(start_date)s).
-            database (str): Target database.
-            schema (str): Target schema.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
             query_params (dict, optional): Key-value dict to bind in query.
+            arrow_dtypes (bool, optional): Back the columns with pd.ArrowDtype instead
+                of NumPy. Zero-copy from the fetched Arrow buffers and keeps integer
+                columns with NULLs as integers. Defaults to False.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
 
         Returns:
-            dict:
-                {
-                    "query_id": str,
-                    "data": pd.DataFrame  # Can be empty
-                }
+            QueryResult:
+                (
+                    query_id: str,
+                    data: pd.DataFrame  # Can be empty
+                )
 
         Raises:
             RuntimeError: If query execution or conversion fails.
         """
-        conn = self.get_active_connection()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute(f"USE DATABASE {database}")
-                cursor.execute(f"USE SCHEMA {schema}")
-                cursor.execute(query, query_params or {})
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
                 query_id = cursor.sfqid
-                df = cursor.fetch_pandas_all()
-                return {
-                    "query_id": query_id,
-                    "data": df
-                }
+                table = cursor.fetch_arrow_all()
+                if table is None:
+                    df = pd.DataFrame(columns=[column[0] for column in cursor.description])
+                else:
+                    # self_destruct frees each Arrow column once converted, so the
+                    # result is not held twice in memory; `table` is unusable after.
+                    df = table.to_pandas(
+                        self_destruct=True,
+                        split_blocks=True,
+                        types_mapper=pd.ArrowDtype if arrow_dtypes else None
+                    )
+                return QueryResult(
+                    query_id=query_id,
+                    data=df
+                )
         except Exception as error:
             raise RuntimeError(f"Failed to fetch rows as DataFrame: {error}")
 
+    def fetch_all_rows_as_arrow(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Executes a query and returns the result as a pyarrow Table.
+
+        Use this for:
+        - Results that are converted straight to Python objects (Table.to_pylist())
+        - Columnar processing without paying for pandas DataFrame construction
+
+        Args:
+            query (str): SQL query with optional placeholders (e.g., %(start_date)s).
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Key-value dict to bind in query.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,
+                    data: pa.Table  # Can have zero rows
+                )
+
+        Raises:
+            RuntimeError: If query execution or conversion fails.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
+                query_id = cursor.sfqid
+                table = cursor.fetch_arrow_all()
+                if table is None:
+                    table = pa.table({column[0]: [] for column in cursor.description})
+                return QueryResult(
+                    query_id=query_id,
+                    data=table
+                )
+        except Exception as error:
+            raise RuntimeError(f"Failed to fetch rows as Arrow table: {error}")
+
+    def fetch_all_rows_as_arrow_batches(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Executes a query and returns its result as a lazy stream of Arrow record batches.
+
+        Result chunks are downloaded only as the iterator is consumed, so large
+        exports (e.g. to Parquet) never hold the whole result in memory. The
+        stream does not need the connection and can be consumed after it is
+        returned to the pool.
+
+        Args:
+            query (str): SQL query with optional placeholders.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Key-value dict to bind in query.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,
+                    data: Iterator[pa.RecordBatch]  # Can yield nothing
+                )
+
+        Raises:
+            RuntimeError: If query execution fails. Errors while downloading
+                a chunk surface from the iterator itself.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
+                query_id = cursor.sfqid
+                result_batches = cursor.get_result_batches() or []
+                return QueryResult(
+                    query_id=query_id,
+                    data=(
+                        record_batch
+                        for result_batch in result_batches
+                        for record_batch in result_batch.to_arrow().to_batches()
+                    )
+                )
+        except Exception as error:
+            raise RuntimeError(f"Failed to fetch rows as Arrow batches: {error}")
+
     def fetch_all_rows_as_tuples(
         self,
         query: str,
-        database: str,
-        schema: str,
-        query_params: Optional[dict] = None
-    ) -> dict:
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        cacheable: bool = True,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
         """
         Executes a query and returns the result as a list of tuples.
 
@@ -222,115 +977,402 @@ class SnowflakeQueryClient:
 
         Args:
             query (str): SQL query with optional placeholders (e.g., %(user_id)s).
-            database (str): Target database.
-            schema (str): Target schema.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Values to substitute in the query.
+            cacheable (bool, optional): Reuse a result cached within `cache_ttl`. Defaults to True.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,  # "cached:<id>" on a cache hit
+                    data: list[tuple]  # Can be empty
+                )
+
+        Raises:
+            RuntimeError: On query failure or connection error.
+        """
+        use_cache = cacheable and self.cache_ttl > 0 and self._is_repeat_query(query)
+        if use_cache:
+            cache_key = self._result_cache_key(query, database, schema, query_params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
+                query_id = cursor.sfqid
+                rows = cursor.fetchall()
+                query_result = QueryResult(
+                    query_id=query_id,
+                    data=rows
+                )
+        except Exception as error:
+            raise RuntimeError(f"Failed to fetch rows as tuples: {error}")
+
+        if use_cache:
+            self._cache_put(cache_key, query, query_result)
+        return query_result
+
+    def iter_rows_as_tuples(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        arraysize: int = 10000,
+        warehouse: Optional[str] = None
+    ) -> Iterator[tuple]:
+        """
+        Executes a query and yields its rows as tuples, `arraysize` rows at a time.
+
+        Use this instead of fetch_all_rows_as_tuples for large results: only
+        one batch of rows is held in memory, and the caller can start work
+        before the last row arrives. The query runs when iteration starts,
+        and the connection stays in use until the iterator is exhausted or closed.
+
+        Args:
+            query (str): SQL query with optional placeholders (e.g., %(user_id)s).
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Values to substitute in the query.
+            arraysize (int, optional): Rows fetched per round. Defaults to 10000.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Yields:
+            tuple: One result row.
+
+        Raises:
+            RuntimeError: On query failure or connection error.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.arraysize = arraysize
+                cursor.execute(*self._bind_params(query, query_params))
+                while True:
+                    rows = cursor.fetchmany(arraysize)
+                    if not rows:
+                        break
+                    yield from rows
+        except GeneratorExit:
+            raise
+        except Exception as error:
+            raise RuntimeError(f"Failed to iterate rows as tuples: {error}")
+
+    def fetch_one_row_as_dict(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None
+    ) -> QueryResult:
+        """
+        Executes a query and returns only its first row as a dict keyed by column name.
+
+        Use this for:
+        - LIMIT 1 lookups where building a DataFrame would be pure overhead
+
+        Args:
+            query (str): SQL query with optional placeholders (e.g., %(status)s).
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
             query_params (dict, optional): Values to substitute in the query.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            QueryResult:
+                (
+                    query_id: str,
+                    data: dict or None  # None when the query returns no rows
+                )
+
+        Raises:
+            RuntimeError: On query failure or connection error.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn, DictCursor) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
+                query_id = cursor.sfqid
+                row = cursor.fetchone()
+                return QueryResult(
+                    query_id=query_id,
+                    data=row
+                )
+        except Exception as error:
+            raise RuntimeError(f"Failed to fetch row as dict: {error}")
+
+    def execute_multi_statement(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        num_statements: int,
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None,
+        rollback_on_error: bool = False
+    ) -> dict:
+        """
+        Executes several ';'-separated statements in one request and returns every result set.
+
+        Use this when:
+        - A sequence of statements (e.g., BEGIN; UPDATE; SELECT; COMMIT) should cost one round-trip
+
+        For explicit transactions pass rollback_on_error=True: a failure then
+        rolls back on the same connection that ran BEGIN. Without a pool such
+        calls are serialised on the shared session, but any other query sharing
+        that session can still land inside the open transaction, so transactional
+        callers should use a client with pool_size set (one session per call).
+
+        Args:
+            query (str): Statements separated by ';', with optional %(key)s-style placeholders.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            num_statements (int): Exact number of statements in `query`.
+            query_params (dict, optional): Parameters to bind across all statements.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+            rollback_on_error (bool, optional): Issue ROLLBACK on this connection if
+                any statement fails. Defaults to False.
 
         Returns:
             dict:
                 {
-                    "query_id": str,
-                    "data": list[tuple]  # Can be empty
+                    "query_id": str,  # ID of the parent multi-statement query
+                    "results": list[dict]  # per statement: {"rowcount": int, "rows": list[dict]}
                 }
 
         Raises:
-            RuntimeError: On query failure or connection error.
+            RuntimeError: If any statement fails.
+        """
+        serialise = rollback_on_error and self._pool is None
+        try:
+            with self._transaction_lock if serialise else nullcontext():
+                with self._connection() as conn, self._cursor(conn, DictCursor) as cursor:
+                    try:
+                        self._use_context(cursor, database, schema, warehouse)
+                        self._forget_context_if_switched(cursor, query)
+                        cursor.execute(*self._bind_params(query, query_params), num_statements=num_statements)
+                        query_id = cursor.sfqid
+                        self._invalidate_written_tables(query, clear_if_unmatched=False)
+                        results = []
+                        while True:
+                            results.append({
+                                "rowcount": cursor.rowcount,
+                                "rows": cursor.fetchall()
+                            })
+                            if cursor.nextset() is None:
+                                break
+                        return {
+                            "query_id": query_id,
+                            "results": results
+                        }
+                    except Exception:
+                        if rollback_on_error:
+                            try:
+                                conn.rollback()
+                            except Exception:
+                                pass
+                        raise
+        except Exception as error:
+            raise RuntimeError(f"Failed to execute multi-statement query: {error}")
+
+    def execute_many(self, specs: list, max_workers: int = 8) -> list:
+        """
+        Runs independent read queries concurrently and returns their results in order.
+
+        Each spec is a dict:
+            {
+                "kind": "scalar" | "tuples" | "df" | "arrow" | "dict",
+                "query": str,
+                "database": str or None,
+                "schema": str or None,
+                "params": dict (optional),
+                "warehouse": str (optional)
+            }
+
+        Queries run on a thread pool capped at min(max_workers, max_concurrent).
+        Give the client a pool_size of at least that many connections so they
+        execute in parallel on Snowflake. Without a pool every query shares one
+        session, whose USE context concurrent queries would switch under each
+        other, so they run one after another instead.
+
+        Args:
+            specs (list[dict]): Queries to run.
+            max_workers (int, optional): Requested concurrency. Defaults to 8.
+
+        Returns:
+            list[QueryResult]: One result per spec, in input order.
+
+        Raises:
+            ValueError: If a spec has an unknown kind.
+            RuntimeError: If any query fails (the first failure in input order).
+        """
+        runners = {
+            "scalar": self.execute_scalar_query,
+            "tuples": self.fetch_all_rows_as_tuples,
+            "df": self.fetch_all_rows_as_dataframe,
+            "arrow": self.fetch_all_rows_as_arrow,
+            "dict": self.fetch_one_row_as_dict
+        }
+        for spec in specs:
+            if spec["kind"] not in runners:
+                raise ValueError(f"Unknown query kind: {spec['kind']!r}")
+        if not specs:
+            return []
+
+        def run(spec: dict) -> QueryResult:
+            return runners[spec["kind"]](
+                query=spec["query"],
+                database=spec.get("database"),
+                schema=spec.get("schema"),
+                query_params=spec.get("params"),
+                warehouse=spec.get("warehouse")
+            )
+
+        if self._pool is None:
+            return [run(spec) for spec in specs]
+        workers = max(1, min(max_workers, self.max_concurrent, len(specs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, specs))
+
+    def execute_dml_query(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        warehouse: Optional[str] = None
+    ) -> dict:
+        """
+        Executes a DML query (INSERT, UPDATE, DELETE) and returns query ID and affected row count.
+
+        Use this method when your query modifies data in a table and you want to know how many rows were impacted.
+
+        Args:
+            query (str): SQL DML query with optional %(key)s-style placeholders.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Parameters to bind in the query.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            dict: {
+                "query_id": str,
+                "rows_affected": int
+            }
+
+        Raises:
+            RuntimeError: If query execution fails.
         """
-        conn = self.get_active_connection()
         try:
-            with conn.cursor() as cursor:
-                cursor.execute(f"USE DATABASE {database}")
-                cursor.execute(f"USE SCHEMA {schema}")
-                cursor.execute(query, query_params or {})
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                cursor.execute(*self._bind_params(query, query_params))
                 query_id = cursor.sfqid
-                rows = cursor.fetchall()
+                rows_affected = cursor.rowcount
+                self._invalidate_written_tables(query)
                 return {
                     "query_id": query_id,
-                    "data": rows
+                    "rows_affected": rows_affected
                 }
         except Exception as error:
-            raise RuntimeError(f"Failed to fetch rows as tuples: {error}")
+            raise RuntimeError(f"Failed to execute DML query: {error}")
+
+    def execute_control_command(
+        self,
+        query: str,
+        database: Optional[str],
+        schema: Optional[str],
+        query_params: Optional[dict] = None,
+        num_statements: Optional[int] = None,
+        warehouse: Optional[str] = None
+    ) -> dict:
+        """
+        Executes control commands such as CALL, ALTER TASK/PROCEDURE without expecting row results.
 
-	def execute_dml_query(
-		self,
-		query: str,
-		database: str,
-		schema: str,
-		query_params: Optional[dict] = None
-	) -> dict:
-		"""
-		Executes a DML query (INSERT, UPDATE, DELETE) and returns query ID and affected row count.
-
-		Use this method when your query modifies data in a table and you want to know how many rows were impacted.
-
-		Args:
-			query (str): SQL DML query with optional %(key)s-style placeholders.
-			database (str): Target database to switch into.
-			schema (str): Target schema to switch into.
-			query_params (dict, optional): Parameters to bind in the query.
-
-		Returns:
-			dict: {
-				"query_id": str,
-				"rows_affected": int
-			}
-
-		Raises:
-			RuntimeError: If query execution fails.
-		"""
-		conn = self.get_active_connection()
-		try:
-			with conn.cursor() as cursor:
-				cursor.execute(f"USE DATABASE {database}")
-				cursor.execute(f"USE SCHEMA {schema}")
-				cursor.execute(query, query_params or {})
-				query_id = cursor.sfqid
-				rows_affected = cursor.rowcount
-				return {
-					"query_id": query_id,
-					"rows_affected": rows_affected
-				}
-		except Exception as error:
-			raise RuntimeError(f"Failed to execute DML query: {error}")
-
-	def execute_control_command(
-		self,
-		query: str,
-		database: str,
-		schema: str,
-		query_params: Optional[dict] = None
-	) -> dict:
-		"""
-		Executes control commands such as CALL, ALTER TASK/PROCEDURE without expecting row results.
-
-		Use this method to:
-		- Trigger stored procedures
-		- Resume, suspend, or alter Snowflake tasks
-		- Execute system control logic
-
-		Args:
-			query (str): SQL command with optional %(key)s-style placeholders.
-			database (str): Target database to switch into.
-			schema (str): Target schema to switch into.
-			query_params (dict, optional): Parameters to bind in the query.
-
-		Returns:
-			dict: {
-				"query_id": str
-			}
-
-		Raises:
-			RuntimeError: If query execution fails.
-		"""
-		conn = self.get_active_connection()
-		try:
-			with conn.cursor() as cursor:
-				cursor.execute(f"USE DATABASE {database}")
-				cursor.execute(f"USE SCHEMA {schema}")
-				cursor.execute(query, query_params or {})
-				query_id = cursor.sfqid
-				return {
-					"query_id": query_id
-				}
-		except Exception as error:
-			raise RuntimeError(f"Failed to execute control command: {error}")
+        Use this method to:
+        - Trigger stored procedures
+        - Resume, suspend, or alter Snowflake tasks
+        - Execute system control logic
+
+        Args:
+            query (str): SQL command with optional %(key)s-style placeholders.
+            database (str, optional): Database to switch into; None skips USE DATABASE.
+            schema (str, optional): Schema to switch into; None skips USE SCHEMA.
+            query_params (dict, optional): Parameters to bind in the query.
+            num_statements (int, optional): Number of ';'-separated statements in `query`.
+                When given, all statements are sent to Snowflake in a single request.
+            warehouse (str, optional): Warehouse to switch into; None keeps the current one.
+
+        Returns:
+            dict: {
+                "query_id": str
+            }
+
+        Raises:
+            RuntimeError: If query execution fails.
+        """
+        try:
+            with self._connection() as conn, self._cursor(conn) as cursor:
+                self._use_context(cursor, database, schema, warehouse)
+                self._forget_context_if_switched(cursor, query)
+                if num_statements:
+                    cursor.execute(*self._bind_params(query, query_params), num_statements=num_statements)
+                else:
+                    cursor.execute(*self._bind_params(query, query_params))
+                query_id = cursor.sfqid
+                self._invalidate_written_tables(query)
+                return {
+                    "query_id": query_id
+                }
+        except Exception as error:
+            raise RuntimeError(f"Failed to execute control command: {error}")
+
+
+@contextmanager
+def snowflake_session(
+    account: str,
+    user: str,
+    password: str,
+    role: str,
+    warehouse: str,
+    database: str,
+    schema: str
+):
+    """
+    Yields a process-wide SnowflakeQueryClient for the given credentials.
+
+    The first session for a set of credentials authenticates; later sessions
+    reuse the same open connection instead of logging in again. The connection
+    is left open when the block exits so the next task can pick it up.
+
+    Args:
+        Same as SnowflakeQueryClient.__init__.
+
+    Yields:
+        SnowflakeQueryClient: Pooled client with an active connection.
+    """
+    # The password is keyed by digest so a wrong or rotated one never reuses
+    # a client that authenticated (and reconnects) with a different password
+    password_digest = hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    pool_key = (account, user, password_digest, role, warehouse, database, schema)
+    with _SESSION_POOL_LOCK:
+        client = _SESSION_POOL.get(pool_key)
+        if client is None:
+            client = SnowflakeQueryClient(
+                account=account,
+                user=user,
+                password=password,
+                role=role,
+                warehouse=warehouse,
+                database=database,
+                schema=schema
+            )
+            _SESSION_POOL[pool_key] = client
+    client.get_active_connection()
+    yield client
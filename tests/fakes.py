@@ -0,0 +1,168 @@
+import sys
+import types
+
+# The client imports the Snowflake connector, pandas and pyarrow at module
+# level; the code paths under test never touch them, so stand-ins are enough
+# when they are not installed. Import this module before any project module.
+for _name in ("snowflake", "snowflake.connector", "pandas", "pyarrow"):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = types.ModuleType(_name)
+if not hasattr(sys.modules["snowflake.connector"], "DictCursor"):
+    sys.modules["snowflake.connector"].DictCursor = object
+    sys.modules["snowflake"].connector = sys.modules["snowflake.connector"]
+
+from snowflake_utils.snowflake_query_client import SnowflakeQueryClient
+
+
+class FakeCursor:
+    """
+    Cursor over the result sets FakeConnection.respond() returns for each query.
+
+    A result set is a (rowcount, rows) pair; multi-statement queries return
+    several and are walked with nextset().
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.sfqid = None
+        self.arraysize = 1
+        self.executed = []
+        self._sets = []
+        self._position = 0
+
+    def _load(self, result_sets):
+        self._sets = list(result_sets)
+        self._position = 0
+
+    def execute(self, query, params=None, **kwargs):
+        self.executed.append(query)
+        self.connection.executed.append((query, params, kwargs))
+        self.sfqid = f"q{len(self.connection.executed)}"
+        response = self.connection.respond(query, params, kwargs)
+        if isinstance(response, Exception):
+            raise response
+        self._load(response)
+
+    def execute_async(self, query, params=None, **kwargs):
+        self.execute(query, params, **kwargs)
+        self.connection.async_results[self.sfqid] = self._sets
+
+    def get_results_from_sfqid(self, query_id):
+        if query_id in self.connection.failed:
+            raise Exception(f"query {query_id} failed")
+        self._load(self.connection.async_results[query_id])
+
+    @property
+    def rowcount(self):
+        return self._sets[0][0] if self._sets else None
+
+    def _rows(self):
+        return self._sets[0][1] if self._sets else []
+
+    def fetchall(self):
+        rows = self._rows()[self._position:]
+        self._position = len(self._rows())
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size):
+        rows = self._rows()[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def nextset(self):
+        self._sets = self._sets[1:]
+        self._position = 0
+        return self if self._sets else None
+
+    def is_closed(self):
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeConnection:
+    """
+    Connection answering every query with `rows` unless `responder` is set.
+
+    `responder(query, params, kwargs)` returns a list of (rowcount, rows)
+    result sets, or an exception to raise. Async queries stay running for
+    `running_polls[query_id]` status checks and fail if listed in `failed`.
+    """
+
+    def __init__(self, rows=(), responder=None):
+        self.rows = list(rows)
+        self.responder = responder
+        self.cursors = []
+        self.executed = []
+        self.async_results = {}
+        self.running_polls = {}
+        self.failed = set()
+        self.rollbacks = 0
+        self.closed = False
+
+    def respond(self, query, params, kwargs):
+        if self.responder is not None:
+            return self.responder(query, params, kwargs)
+        return [(len(self.rows), self.rows)]
+
+    def cursor(self, cursor_class=None):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def get_query_status_throw_if_error(self, query_id):
+        if query_id in self.failed:
+            raise Exception(f"query {query_id} failed")
+        remaining = self.running_polls.get(query_id, 0)
+        if remaining:
+            self.running_polls[query_id] = remaining - 1
+            return "RUNNING"
+        return "SUCCESS"
+
+    @staticmethod
+    def is_still_running(status):
+        return status == "RUNNING"
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def make_client(rows=(), connection_factory=None, **kwargs):
+    """
+    Returns (client, connections): a client whose connect() hands out FakeConnections.
+
+    Every connection opened is appended to `connections`. Each is built by
+    `connection_factory` when given, otherwise as a FakeConnection over `rows`.
+    """
+    client = SnowflakeQueryClient(
+        account="acct", user="user", password="pw", role="role",
+        warehouse="WH", database="DB", schema="S", **kwargs
+    )
+    connections = []
+
+    def connect(**_):
+        if connection_factory is not None:
+            connection = connection_factory()
+        else:
+            connection = FakeConnection(rows)
+        connections.append(connection)
+        return connection
+
+    sys.modules["snowflake.connector"].connect = connect
+    return client, connections
@@ -0,0 +1,40 @@
+import logging
+import unittest
+
+from utils.log_utils import LogBlock
+
+
+class CapturingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class LogBlockTest(unittest.TestCase):
+    def setUp(self):
+        self.log = LogBlock(logger_name="test_log_utils")
+        self.handler = CapturingHandler()
+        self.log.logger.addHandler(self.handler)
+        self.log.logger.setLevel(logging.DEBUG)
+        self.log.logger.propagate = False
+
+    def tearDown(self):
+        self.log.logger.removeHandler(self.handler)
+
+    def test_timezone_is_the_third_positional_argument(self):
+        self.log.info("KEY", "100% done", "UTC")
+        message = self.handler.messages[0]
+        self.assertIn("log time in UTC:", message)
+        self.assertNotIn("America/Los_Angeles", message)
+        self.assertTrue(message.endswith("message:\n100% done"))
+
+    def test_args_after_timezone_are_applied_to_the_message(self):
+        self.log.warning("KEY", "claimed %s rows", "UTC", 3)
+        self.assertTrue(self.handler.messages[0].endswith("message:\nclaimed 3 rows"))
+
+
+if __name__ == "__main__":
+    unittest.main()
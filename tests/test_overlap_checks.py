@@ -0,0 +1,56 @@
+import unittest
+
+from tests import fakes  # noqa: F401  (installs stand-in modules)
+import pandas as pd
+from snowflake_utils.snowflake_query_client import QueryResult
+from pipeline_logic_scripts.snowflake_funcs.overlap_checks import find_overlapping_records_for_input
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def fetch_all_rows_as_dataframe(self, **kwargs):
+        self.calls.append(kwargs)
+        return QueryResult(query_id="q1", data=[])
+
+
+def check(start_ts, end_ts):
+    client = RecordingClient()
+    result = find_overlapping_records_for_input(
+        snowflake_client=client,
+        pipeline_name="pipe",
+        index_name="idx",
+        start_ts=start_ts,
+        end_ts=end_ts,
+        database="DB",
+        schema="S",
+        table="status_tbl"
+    )
+    return result, client.calls
+
+
+class EmptyRangeGuardTest(unittest.TestCase):
+    def test_range_that_sorts_inverted_as_text_still_queries(self):
+        result, calls = check("2025-06-11T00:00:00", "2025-06-11 01:00:00")
+        self.assertEqual(result.query_id, "q1")
+        self.assertEqual(calls[0]["query_params"]["start_day"], "2025-06-11")
+
+    def test_naive_and_aware_pair_still_queries(self):
+        result, calls = check("2025-06-11T00:00:00", "2025-06-11T01:00:00+00:00")
+        self.assertEqual(result.query_id, "q1")
+        self.assertEqual(len(calls), 1)
+
+    @unittest.skipUnless(hasattr(pd, "DataFrame"), "pandas is not installed")
+    def test_inverted_range_skips_the_query(self):
+        result, calls = check("2025-06-11T01:00:00", "2025-06-11T00:00:00")
+        self.assertEqual(result.query_id, "SKIPPED")
+        self.assertEqual(calls, [])
+
+    def test_unparseable_timestamp_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            check("not a timestamp", "2025-06-11T00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
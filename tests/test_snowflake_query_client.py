@@ -0,0 +1,221 @@
+import unittest
+from unittest import mock
+
+from tests.fakes import FakeConnection, make_client
+from snowflake_utils import snowflake_query_client
+from snowflake_utils.snowflake_query_client import QueryResult, _to_qmark, snowflake_session
+
+
+class TupleFetchTest(unittest.TestCase):
+    ROWS = [("PENDING", 2), ("COMPLETED", 1), ("FAILED", 4)]
+
+    def test_fetch_all_rows_as_tuples_returns_query_result(self):
+        client, _ = make_client(self.ROWS)
+        result = client.fetch_all_rows_as_tuples("SELECT 1", None, None)
+        self.assertIsInstance(result, QueryResult)
+        self.assertEqual(result.query_id, "q1")
+        self.assertEqual(result.data, self.ROWS)
+
+    def test_fetch_all_rows_as_tuples_serves_repeats_from_cache(self):
+        client, connections = make_client(self.ROWS, cache_ttl=60)
+        for _ in range(3):
+            result = client.fetch_all_rows_as_tuples("SELECT 1", None, None)
+        self.assertEqual(result, QueryResult(query_id="cached:q2", data=self.ROWS))
+        self.assertEqual(len(connections[0].executed), 2)
+
+    def test_iter_rows_as_tuples_yields_every_row(self):
+        client, connections = make_client(self.ROWS)
+        rows = list(client.iter_rows_as_tuples("SELECT 1", None, None, arraysize=2))
+        self.assertEqual(rows, self.ROWS)
+        self.assertEqual(connections[0].cursors[0].arraysize, 2)
+
+    def test_iter_rows_as_tuples_wraps_errors(self):
+        client, connections = make_client(self.ROWS)
+        client.get_active_connection().cursor = None
+        with self.assertRaises(RuntimeError):
+            list(client.iter_rows_as_tuples("SELECT 1", None, None))
+
+
+class QmarkRewriteTest(unittest.TestCase):
+    def test_list_values_expand_to_one_placeholder_each(self):
+        query, values = _to_qmark(
+            "SELECT * FROM t WHERE status IN (%(statuses)s) AND day = %(day)s",
+            {"statuses": ["pending", "failed"], "day": "2025-06-11"}
+        )
+        self.assertEqual(query, "SELECT * FROM t WHERE status IN (?, ?) AND day = ?")
+        self.assertEqual(values, ["pending", "failed", "2025-06-11"])
+
+    def test_escaped_percent_is_unescaped(self):
+        query, values = _to_qmark("SELECT * FROM t WHERE name LIKE 'a%%' AND id = %(id)s", {"id": 3})
+        self.assertEqual(query, "SELECT * FROM t WHERE name LIKE 'a%' AND id = ?")
+        self.assertEqual(values, [3])
+
+    def test_repeated_placeholder_binds_its_value_each_time(self):
+        query, values = _to_qmark("SELECT %(x)s WHERE a = %(x)s", {"x": 1})
+        self.assertEqual(query, "SELECT ? WHERE a = ?")
+        self.assertEqual(values, [1, 1])
+
+    def test_missing_key_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            _to_qmark("SELECT %(missing)s", {})
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def test_nested_borrow_on_one_thread_reuses_the_connection(self):
+        client, connections = make_client(pool_size=2)
+        with client._connection() as outer:
+            with client._connection() as inner:
+                self.assertIs(inner, outer)
+        self.assertEqual(len(connections), 1)
+        self.assertEqual(client._pool.qsize(), 1)
+
+    def test_pool_timeout_raises_connection_error(self):
+        client, _ = make_client(pool_size=1, pool_timeout=0.01)
+        client._borrow_pooled_connection()
+        with self.assertRaises(ConnectionError):
+            client._borrow_pooled_connection()
+
+    def test_closed_connection_is_replaced(self):
+        client, connections = make_client(pool_size=1)
+        with client._connection() as first:
+            pass
+        first.close()
+        with client._connection() as second:
+            self.assertIsNot(second, first)
+        self.assertEqual(len(connections), 2)
+        self.assertEqual(client._pool_created, 1)
+
+    def test_failed_creation_releases_its_pool_slot(self):
+        outcomes = [FakeConnection, RuntimeError]
+
+        def factory():
+            outcome = outcomes.pop(0)
+            if outcome is RuntimeError:
+                raise RuntimeError("login failed")
+            return outcome()
+
+        client, _ = make_client(pool_size=1, connection_factory=factory)
+        with client._connection() as first:
+            pass
+        first.close()
+        with self.assertRaises(ConnectionError):
+            with client._connection():
+                pass
+        self.assertEqual(client._pool_created, 0)
+
+    def test_failed_first_connection_releases_its_pool_slot(self):
+        def factory():
+            raise RuntimeError("login failed")
+
+        client, _ = make_client(pool_size=1, connection_factory=factory)
+        with self.assertRaises(ConnectionError):
+            client._borrow_pooled_connection()
+        self.assertEqual(client._pool_created, 0)
+
+    def test_close_drains_the_pool(self):
+        client, connections = make_client(pool_size=2)
+        first = client._borrow_pooled_connection()
+        second = client._borrow_pooled_connection()
+        client._pool.put(first)
+        client._pool.put(second)
+        client.close()
+        self.assertTrue(all(connection.closed for connection in connections))
+        self.assertEqual(client._pool.qsize(), 0)
+        self.assertEqual(client._pool_created, 0)
+
+
+class PredictorTest(unittest.TestCase):
+    def make_predicting_client(self):
+        client, connections = make_client([(7,)])
+        client.register_predictor(lambda query, params: 42 if "COUNT" in query else None)
+        return client, connections
+
+    def test_predictor_answers_cacheable_calls_without_querying(self):
+        client, connections = self.make_predicting_client()
+        result = client.execute_scalar_query("SELECT COUNT(*) FROM t", None, None)
+        self.assertEqual(result, QueryResult(query_id="cached:predictor", data=42))
+        self.assertEqual(connections, [])
+
+    def test_predictor_is_skipped_when_not_cacheable(self):
+        client, connections = self.make_predicting_client()
+        result = client.execute_scalar_query("SELECT COUNT(*) FROM t", None, None, cacheable=False)
+        self.assertEqual(result, QueryResult(query_id="q1", data=7))
+        self.assertEqual(len(connections[0].executed), 1)
+
+    def test_none_from_predictor_falls_through_to_the_query(self):
+        client, _ = self.make_predicting_client()
+        result = client.execute_scalar_query("SELECT MAX(x) FROM t", None, None)
+        self.assertEqual(result.data, 7)
+
+
+def count_responder(query, params, kwargs):
+    return [(1, [(params["n"],)])]
+
+
+@mock.patch.object(snowflake_query_client, "_ASYNC_POLL_INITIAL_DELAY", 0.001)
+class AsyncScalarTest(unittest.TestCase):
+    def make_async_client(self):
+        client, connections = make_client(connection_factory=lambda: FakeConnection(responder=count_responder))
+        return client, client.get_active_connection()
+
+    def test_await_scalar_result_polls_until_done(self):
+        client, connection = self.make_async_client()
+        query_id = client.execute_scalar_async("SELECT %(n)s", None, None, {"n": 5})
+        connection.running_polls[query_id] = 3
+        self.assertEqual(client.await_scalar_result(query_id), QueryResult(query_id=query_id, data=5))
+        self.assertEqual(connection.running_polls[query_id], 0)
+
+    def test_await_scalar_result_times_out(self):
+        client, connection = self.make_async_client()
+        query_id = client.execute_scalar_async("SELECT %(n)s", None, None, {"n": 5})
+        connection.running_polls[query_id] = 10 ** 6
+        with self.assertRaises(TimeoutError):
+            client.await_scalar_result(query_id, timeout=0.01)
+
+    def test_await_scalar_result_raises_for_failed_query(self):
+        client, connection = self.make_async_client()
+        query_id = client.execute_scalar_async("SELECT %(n)s", None, None, {"n": 5})
+        connection.failed.add(query_id)
+        with self.assertRaises(RuntimeError):
+            client.await_scalar_result(query_id)
+
+    def test_execute_many_async_returns_results_in_input_order(self):
+        client, connection = self.make_async_client()
+        # q1 finishes last, q3 first
+        connection.running_polls.update({"q1": 4, "q2": 2})
+        specs = [{"query": "SELECT %(n)s", "database": None, "schema": None, "params": {"n": n}} for n in (1, 2, 3)]
+        results = client.execute_many_async(specs)
+        self.assertEqual([result.data for result in results], [1, 2, 3])
+        self.assertEqual([result.query_id for result in results], ["q1", "q2", "q3"])
+
+    def test_execute_many_async_raises_for_failed_query(self):
+        client, connection = self.make_async_client()
+        connection.failed.add("q2")
+        specs = [{"query": "SELECT %(n)s", "params": {"n": n}} for n in (1, 2)]
+        with self.assertRaises(RuntimeError):
+            client.execute_many_async(specs)
+
+
+class SnowflakeSessionTest(unittest.TestCase):
+    CREDENTIALS = dict(account="acct", user="user", role="role", warehouse="WH", database="DB", schema="S")
+
+    def test_same_credentials_reuse_the_client(self):
+        make_client()
+        with snowflake_session(password="pw", **self.CREDENTIALS) as first:
+            pass
+        with snowflake_session(password="pw", **self.CREDENTIALS) as second:
+            pass
+        self.assertIs(first, second)
+
+    def test_different_password_gets_its_own_client(self):
+        make_client()
+        with snowflake_session(password="pw", **self.CREDENTIALS) as first:
+            pass
+        with snowflake_session(password="rotated", **self.CREDENTIALS) as second:
+            pass
+        self.assertIsNot(first, second)
+        self.assertEqual(second.password, "rotated")
+
+
+if __name__ == "__main__":
+    unittest.main()
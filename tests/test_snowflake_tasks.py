@@ -0,0 +1,150 @@
+import sqlite3
+import unittest
+
+from tests.fakes import FakeConnection, make_client
+from pipeline_logic_scripts.snowflake_funcs import snowflake_tasks
+
+
+def run_overlap_scan(windows):
+    """
+    Runs _OVERLAPPING_WINDOWS_SQL in sqlite on (start, end) pairs.
+
+    The Snowflake-specific day filter (the first CTE) is replaced by a
+    filtered_day_data table holding `windows`; the scan itself runs unchanged.
+    """
+    template = snowflake_tasks._OVERLAPPING_WINDOWS_SQL
+    scan = "WITH " + template[template.index("max_end_by_start AS ("):]
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE filtered_day_data (query_window_start_ts, query_window_end_ts)")
+    db.executemany("INSERT INTO filtered_day_data VALUES (?, ?)", windows)
+    return db.execute(scan).fetchall()
+
+
+class OverlappingWindowsSqlTest(unittest.TestCase):
+    def test_each_overlapping_window_is_reported_once(self):
+        rows = run_overlap_scan([(0, 10), (1, 10), (5, 8)])
+        self.assertEqual(rows, [(1, 10, 0, 10), (5, 8, 0, 10)])
+
+    def test_contiguous_windows_do_not_overlap(self):
+        self.assertEqual(run_overlap_scan([(0, 5), (5, 10), (10, 15)]), [])
+
+
+class QualifiedTableTest(unittest.TestCase):
+    def test_bare_name_gets_database_and_schema(self):
+        self.assertEqual(snowflake_tasks._qualified_table("DB", "S", "status_tbl"), "DB.S.status_tbl")
+
+    def test_schema_qualified_name_gets_database(self):
+        self.assertEqual(snowflake_tasks._qualified_table("DB", "S", "STAGING.status_tbl"), "DB.STAGING.status_tbl")
+
+    def test_fully_qualified_name_is_unchanged(self):
+        self.assertEqual(snowflake_tasks._qualified_table("DB", "S", "OTHER.STAGING.status_tbl"), "OTHER.STAGING.status_tbl")
+
+
+CLAIMED_ROW = {"pipeline_name": "pipe", "index_name": "idx", "query_window_start_ts": "2025-06-11T00:00:00.000000"}
+
+
+def claim_responder(update_rowcount, selected_rows):
+    def respond(query, params, kwargs):
+        if "BEGIN" not in query:
+            return [(0, [])]
+        # BEGIN; SET; UPDATE; SELECT; COMMIT
+        return [(0, []), (1, []), (update_rowcount, [{"number of rows updated": update_rowcount}]),
+                (len(selected_rows), selected_rows), (0, [])]
+    return respond
+
+
+def claim(client):
+    return snowflake_tasks.claim_oldest_pending_record(
+        table_name="status_tbl",
+        database="DB",
+        schema="S",
+        snowflake_client=client,
+        logger=snowflake_tasks.logger
+    )
+
+
+class ClaimOldestPendingRecordTest(unittest.TestCase):
+    def make_claim_client(self, responder):
+        return make_client(pool_size=2, connection_factory=lambda: FakeConnection(responder=responder))
+
+    def test_claimed_row_comes_from_the_select_result(self):
+        client, connections = self.make_claim_client(claim_responder(1, [dict(CLAIMED_ROW)]))
+        result = claim(client)
+        self.assertEqual(result["record"], CLAIMED_ROW)
+        self.assertEqual(result["query_id"], "q1")
+        _, params, kwargs = connections[0].executed[0]
+        self.assertEqual(kwargs["num_statements"], snowflake_tasks._CLAIM_OLDEST_STATEMENTS)
+        self.assertEqual(params, {"from_status": "pending", "to_status": "in_progress"})
+
+    def test_record_is_none_when_another_worker_won(self):
+        client, _ = self.make_claim_client(claim_responder(0, [dict(CLAIMED_ROW)]))
+        self.assertIsNone(claim(client)["record"])
+
+    def test_claim_invalidates_the_status_cache(self):
+        cache_key = ("count", "DB", "S", "status_tbl", "pending")
+        snowflake_tasks._status_cache_put(cache_key, {"query_id": "q0", "row_count": 3})
+        client, _ = self.make_claim_client(claim_responder(1, [dict(CLAIMED_ROW)]))
+        claim(client)
+        self.assertIsNone(snowflake_tasks._status_cache_get(cache_key, 60))
+
+    def test_failure_rolls_back_on_the_same_connection(self):
+        client, connections = self.make_claim_client(lambda query, params, kwargs: Exception("UPDATE failed"))
+        with self.assertRaises(RuntimeError):
+            claim(client)
+        self.assertEqual(len(connections), 1)
+        self.assertEqual(connections[0].rollbacks, 1)
+        self.assertEqual(len(connections[0].executed), 1)
+
+
+def status_count_responder(counts):
+    def respond(query, params, kwargs):
+        return [(1, [(counts[params["pipeline_status"]],)])]
+    return respond
+
+
+def count_async(client, pipeline_status):
+    return snowflake_tasks.count_records_by_pipeline_status_async(
+        table_name="status_tbl",
+        database="DB",
+        schema="S",
+        pipeline_status=pipeline_status,
+        snowflake_client=client,
+        logger=snowflake_tasks.logger
+    )
+
+
+class CountRecordsAsyncTest(unittest.TestCase):
+    def setUp(self):
+        snowflake_tasks.invalidate_status_cache("status_tbl")
+
+    def make_count_client(self, counts):
+        return make_client(connection_factory=lambda: FakeConnection(responder=status_count_responder(counts)))
+
+    def test_cached_count_resolves_without_submitting(self):
+        snowflake_tasks._status_cache_put(
+            ("count", "DB", "S", "status_tbl", "pending"), {"query_id": "q9", "row_count": 3}
+        )
+        client, connections = self.make_count_client({})
+        handle = count_async(client, "pending")
+        self.assertEqual(snowflake_tasks.await_all([handle]), [{"query_id": "cached:q9", "row_count": 3}])
+        self.assertEqual(connections, [])
+
+    def test_await_all_returns_results_in_input_order(self):
+        client, connections = self.make_count_client({"pending": 2, "failed": 0, "completed": 7})
+        handles = [count_async(client, status) for status in ("completed", "pending", "failed")]
+        self.assertEqual(len(connections[0].executed), 3)
+        self.assertEqual(
+            [result["row_count"] for result in snowflake_tasks.await_all(handles)],
+            [7, 2, 0]
+        )
+
+    def test_failed_count_raises_runtime_error(self):
+        client, connections = self.make_count_client({"pending": 2})
+        handle = count_async(client, "pending")
+        connections[0].failed.add(handle["query_id"])
+        with self.assertRaises(RuntimeError):
+            snowflake_tasks.await_all([handle])
+
+
+if __name__ == "__main__":
+    unittest.main()
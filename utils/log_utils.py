@@ -1,6 +1,23 @@
 import logging
-import pendulum
-import inspect
+import sys
+from datetime import datetime, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+# ZoneInfo objects by name, so each log line skips the tz database lookup.
+_TZ_CACHE: dict = {"UTC": dt_timezone.utc}
+
+
+def _tz(name: str):
+    tz = _TZ_CACHE.get(name)
+    if tz is None:
+        tz = _TZ_CACHE[name] = ZoneInfo(name)
+    return tz
+
+
+def _timestamp(moment: datetime) -> str:
+    # "YYYY-MM-DD HH:MM:SS"; isoformat is C-implemented and skips strftime's
+    # locale handling. tzinfo is dropped so no "+00:00" offset is appended.
+    return moment.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
 
 
 class LogBlock:
@@ -9,44 +26,103 @@ class LogBlock:
         self.max_depth = max_depth
 
     def _get_caller_info(self):
-        stack = inspect.stack()
+        # Walk only the frames we report on; inspect.stack() would build a
+        # FrameInfo (with source context) for every frame on the stack.
+        frame = sys._getframe(1)
         trace = []
 
-        for frame_info in stack[1:self.max_depth + 1]:
-            filename = frame_info.filename.split("/")[-1]
-            function = frame_info.function
+        for _ in range(self.max_depth):
+            if frame is None:
+                break
+            path = frame.f_code.co_filename
+            filename = path[path.rfind("/") + 1:]
+            function = frame.f_code.co_name
 
             if "log_utils.py" not in filename:
                 trace.append(f"{filename}::{function}")
+            frame = frame.f_back
 
         if trace:
             return " -> ".join(reversed(trace))
         return "unknown"
 
     def _format_log(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles") -> str:
-        utc_time = pendulum.now("UTC").to_datetime_string()
+        now_utc = datetime.now(dt_timezone.utc)
         caller = self._get_caller_info()
+        return _render_block(key, message, timezone, now_utc, caller)
+
+    def _lazy_log(self, key, message, timezone, args) -> "_LazyLog":
+        # Called directly from the level methods so the caller frames line up
+        # with _format_log's; the text itself is only built by str().
+        return _LazyLog(key, message, timezone, args, datetime.now(dt_timezone.utc), self._get_caller_info())
+
+    def info(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles", *args):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("%s", self._lazy_log(key, message, timezone, args))
+
+    def info_lazy(self, key: str = None, message_factory=None, timezone: str = "America/Los_Angeles"):
+        """Like info(), but only builds the message when INFO is enabled for this logger."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_log(key, message_factory(), timezone))
+
+    def debug_lazy(self, key: str = None, message_factory=None, timezone: str = "America/Los_Angeles"):
+        """Like debug(), but only builds the message when DEBUG is enabled for this logger."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_log(key, message_factory(), timezone))
+
+    def warning(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles", *args):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("%s", self._lazy_log(key, message, timezone, args))
+
+    def error(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles", *args):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error("%s", self._lazy_log(key, message, timezone, args))
+
+    def debug(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles", *args):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s", self._lazy_log(key, message, timezone, args))
+
+
+def _render_block(key, message, timezone, now_utc, caller) -> str:
+    utc_time = _timestamp(now_utc)
+
+    parts = [f"[{key}]\n"] if key else []
+    parts.append(f"caller: {caller}")
 
-        log_block = f"\n[{key}]" if key else ""
-        log_block += f"\ncaller: {caller}"
+    if timezone:
+        if timezone == "UTC":
+            local_time = utc_time
+        else:
+            local_time = _timestamp(now_utc.astimezone(_tz(timezone)))
+        parts.append(f"\nlog time in {timezone}: {local_time}")
 
-        if timezone:
-            local_time = pendulum.now(timezone).to_datetime_string()
-            log_block += f"\nlog time in {timezone}: {local_time}"
+    parts.append(f"\nlog time in UTC: {utc_time}\nmessage:\n{message}")
 
-        log_block += f"\nlog time in UTC: {utc_time}"
-        log_block += f"\nmessage:\n{message}"
+    return "".join(parts).strip()
 
-        return log_block.strip()
 
-    def info(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles"):
-        self.logger.info(self._format_log(key, message, timezone))
+class _LazyLog:
+    """
+    A LogBlock record whose text is built on first str(), not when it is logged.
 
-    def warning(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles"):
-        self.logger.warning(self._format_log(key, message, timezone))
+    The time and caller are captured up front; the block and `message % args`
+    are built by the first handler that formats the record and cached, so with
+    several handlers attached the string is built once rather than per handler.
+    A QueueHandler still formats on the logging thread (in prepare()).
+    """
+    __slots__ = ("key", "message", "timezone", "args", "now_utc", "caller", "_text")
 
-    def error(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles"):
-        self.logger.error(self._format_log(key, message, timezone))
+    def __init__(self, key, message, timezone, args, now_utc, caller):
+        self.key = key
+        self.message = message
+        self.timezone = timezone
+        self.args = args
+        self.now_utc = now_utc
+        self.caller = caller
+        self._text = None
 
-    def debug(self, key: str = None, message: str = None, timezone: str = "America/Los_Angeles"):
-        self.logger.debug(self._format_log(key, message, timezone))
+    def __str__(self) -> str:
+        if self._text is None:
+            message = self.message % self.args if self.args else self.message
+            self._text = _render_block(self.key, message, self.timezone, self.now_utc, self.caller)
+        return self._text